@@ -0,0 +1,747 @@
+// 部首查詢表 (由 src/generate_radicals.py 產生，請勿手動修改)
+
+export interface Radical {
+  char: string
+  number: number
+  strokes: number
+}
+
+// 部首編號 → 部首資料 (索引 0 不使用)
+export const RADICALS: readonly Radical[] = [
+  { char: '', number: 0, strokes: 0 },
+  { char: "一", number: 1, strokes: 1 },
+  { char: "丨", number: 2, strokes: 1 },
+  { char: "丶", number: 3, strokes: 1 },
+  { char: "丿", number: 4, strokes: 1 },
+  { char: "乙", number: 5, strokes: 1 },
+  { char: "亅", number: 6, strokes: 1 },
+  { char: "二", number: 7, strokes: 2 },
+  { char: "亠", number: 8, strokes: 2 },
+  { char: "人", number: 9, strokes: 2 },
+  { char: "儿", number: 10, strokes: 2 },
+  { char: "入", number: 11, strokes: 2 },
+  { char: "八", number: 12, strokes: 2 },
+  { char: "冂", number: 13, strokes: 2 },
+  { char: "冖", number: 14, strokes: 2 },
+  { char: "冫", number: 15, strokes: 2 },
+  { char: "几", number: 16, strokes: 2 },
+  { char: "凵", number: 17, strokes: 2 },
+  { char: "刀", number: 18, strokes: 2 },
+  { char: "力", number: 19, strokes: 2 },
+  { char: "勹", number: 20, strokes: 2 },
+  { char: "匕", number: 21, strokes: 2 },
+  { char: "匚", number: 22, strokes: 2 },
+  { char: "匸", number: 23, strokes: 2 },
+  { char: "十", number: 24, strokes: 2 },
+  { char: "卜", number: 25, strokes: 2 },
+  { char: "卩", number: 26, strokes: 2 },
+  { char: "厂", number: 27, strokes: 2 },
+  { char: "厶", number: 28, strokes: 2 },
+  { char: "又", number: 29, strokes: 2 },
+  { char: "口", number: 30, strokes: 3 },
+  { char: "囗", number: 31, strokes: 3 },
+  { char: "土", number: 32, strokes: 3 },
+  { char: "士", number: 33, strokes: 3 },
+  { char: "夂", number: 34, strokes: 3 },
+  { char: "夊", number: 35, strokes: 3 },
+  { char: "夕", number: 36, strokes: 3 },
+  { char: "大", number: 37, strokes: 3 },
+  { char: "女", number: 38, strokes: 3 },
+  { char: "子", number: 39, strokes: 3 },
+  { char: "宀", number: 40, strokes: 3 },
+  { char: "寸", number: 41, strokes: 3 },
+  { char: "小", number: 42, strokes: 3 },
+  { char: "尢", number: 43, strokes: 3 },
+  { char: "尸", number: 44, strokes: 3 },
+  { char: "屮", number: 45, strokes: 3 },
+  { char: "山", number: 46, strokes: 3 },
+  { char: "巛", number: 47, strokes: 3 },
+  { char: "工", number: 48, strokes: 3 },
+  { char: "己", number: 49, strokes: 3 },
+  { char: "巾", number: 50, strokes: 3 },
+  { char: "干", number: 51, strokes: 3 },
+  { char: "幺", number: 52, strokes: 3 },
+  { char: "广", number: 53, strokes: 3 },
+  { char: "廴", number: 54, strokes: 3 },
+  { char: "廾", number: 55, strokes: 3 },
+  { char: "弋", number: 56, strokes: 3 },
+  { char: "弓", number: 57, strokes: 3 },
+  { char: "彐", number: 58, strokes: 3 },
+  { char: "彡", number: 59, strokes: 3 },
+  { char: "彳", number: 60, strokes: 3 },
+  { char: "心", number: 61, strokes: 4 },
+  { char: "戈", number: 62, strokes: 4 },
+  { char: "戶", number: 63, strokes: 4 },
+  { char: "手", number: 64, strokes: 4 },
+  { char: "支", number: 65, strokes: 4 },
+  { char: "攴", number: 66, strokes: 4 },
+  { char: "文", number: 67, strokes: 4 },
+  { char: "斗", number: 68, strokes: 4 },
+  { char: "斤", number: 69, strokes: 4 },
+  { char: "方", number: 70, strokes: 4 },
+  { char: "无", number: 71, strokes: 4 },
+  { char: "日", number: 72, strokes: 4 },
+  { char: "曰", number: 73, strokes: 4 },
+  { char: "月", number: 74, strokes: 4 },
+  { char: "木", number: 75, strokes: 4 },
+  { char: "欠", number: 76, strokes: 4 },
+  { char: "止", number: 77, strokes: 4 },
+  { char: "歹", number: 78, strokes: 4 },
+  { char: "殳", number: 79, strokes: 4 },
+  { char: "毋", number: 80, strokes: 4 },
+  { char: "比", number: 81, strokes: 4 },
+  { char: "毛", number: 82, strokes: 4 },
+  { char: "氏", number: 83, strokes: 4 },
+  { char: "气", number: 84, strokes: 4 },
+  { char: "水", number: 85, strokes: 4 },
+  { char: "火", number: 86, strokes: 4 },
+  { char: "爪", number: 87, strokes: 4 },
+  { char: "父", number: 88, strokes: 4 },
+  { char: "爻", number: 89, strokes: 4 },
+  { char: "爿", number: 90, strokes: 4 },
+  { char: "片", number: 91, strokes: 4 },
+  { char: "牙", number: 92, strokes: 4 },
+  { char: "牛", number: 93, strokes: 4 },
+  { char: "犬", number: 94, strokes: 4 },
+  { char: "玄", number: 95, strokes: 5 },
+  { char: "玉", number: 96, strokes: 5 },
+  { char: "瓜", number: 97, strokes: 5 },
+  { char: "瓦", number: 98, strokes: 5 },
+  { char: "甘", number: 99, strokes: 5 },
+  { char: "生", number: 100, strokes: 5 },
+  { char: "用", number: 101, strokes: 5 },
+  { char: "田", number: 102, strokes: 5 },
+  { char: "疋", number: 103, strokes: 5 },
+  { char: "疒", number: 104, strokes: 5 },
+  { char: "癶", number: 105, strokes: 5 },
+  { char: "白", number: 106, strokes: 5 },
+  { char: "皮", number: 107, strokes: 5 },
+  { char: "皿", number: 108, strokes: 5 },
+  { char: "目", number: 109, strokes: 5 },
+  { char: "矛", number: 110, strokes: 5 },
+  { char: "矢", number: 111, strokes: 5 },
+  { char: "石", number: 112, strokes: 5 },
+  { char: "示", number: 113, strokes: 5 },
+  { char: "禸", number: 114, strokes: 5 },
+  { char: "禾", number: 115, strokes: 5 },
+  { char: "穴", number: 116, strokes: 5 },
+  { char: "立", number: 117, strokes: 5 },
+  { char: "竹", number: 118, strokes: 6 },
+  { char: "米", number: 119, strokes: 6 },
+  { char: "糸", number: 120, strokes: 6 },
+  { char: "缶", number: 121, strokes: 6 },
+  { char: "网", number: 122, strokes: 6 },
+  { char: "羊", number: 123, strokes: 6 },
+  { char: "羽", number: 124, strokes: 6 },
+  { char: "老", number: 125, strokes: 6 },
+  { char: "而", number: 126, strokes: 6 },
+  { char: "耒", number: 127, strokes: 6 },
+  { char: "耳", number: 128, strokes: 6 },
+  { char: "聿", number: 129, strokes: 6 },
+  { char: "肉", number: 130, strokes: 6 },
+  { char: "臣", number: 131, strokes: 6 },
+  { char: "自", number: 132, strokes: 6 },
+  { char: "至", number: 133, strokes: 6 },
+  { char: "臼", number: 134, strokes: 6 },
+  { char: "舌", number: 135, strokes: 6 },
+  { char: "舛", number: 136, strokes: 6 },
+  { char: "舟", number: 137, strokes: 6 },
+  { char: "艮", number: 138, strokes: 6 },
+  { char: "色", number: 139, strokes: 6 },
+  { char: "艸", number: 140, strokes: 6 },
+  { char: "虍", number: 141, strokes: 6 },
+  { char: "虫", number: 142, strokes: 6 },
+  { char: "血", number: 143, strokes: 6 },
+  { char: "行", number: 144, strokes: 6 },
+  { char: "衣", number: 145, strokes: 6 },
+  { char: "襾", number: 146, strokes: 6 },
+  { char: "見", number: 147, strokes: 7 },
+  { char: "角", number: 148, strokes: 7 },
+  { char: "言", number: 149, strokes: 7 },
+  { char: "谷", number: 150, strokes: 7 },
+  { char: "豆", number: 151, strokes: 7 },
+  { char: "豕", number: 152, strokes: 7 },
+  { char: "豸", number: 153, strokes: 7 },
+  { char: "貝", number: 154, strokes: 7 },
+  { char: "赤", number: 155, strokes: 7 },
+  { char: "走", number: 156, strokes: 7 },
+  { char: "足", number: 157, strokes: 7 },
+  { char: "身", number: 158, strokes: 7 },
+  { char: "車", number: 159, strokes: 7 },
+  { char: "辛", number: 160, strokes: 7 },
+  { char: "辰", number: 161, strokes: 7 },
+  { char: "辵", number: 162, strokes: 7 },
+  { char: "邑", number: 163, strokes: 7 },
+  { char: "酉", number: 164, strokes: 7 },
+  { char: "釆", number: 165, strokes: 7 },
+  { char: "里", number: 166, strokes: 7 },
+  { char: "金", number: 167, strokes: 8 },
+  { char: "長", number: 168, strokes: 8 },
+  { char: "門", number: 169, strokes: 8 },
+  { char: "阜", number: 170, strokes: 8 },
+  { char: "隶", number: 171, strokes: 8 },
+  { char: "隹", number: 172, strokes: 8 },
+  { char: "雨", number: 173, strokes: 8 },
+  { char: "靑", number: 174, strokes: 8 },
+  { char: "非", number: 175, strokes: 8 },
+  { char: "面", number: 176, strokes: 9 },
+  { char: "革", number: 177, strokes: 9 },
+  { char: "韋", number: 178, strokes: 9 },
+  { char: "韭", number: 179, strokes: 9 },
+  { char: "音", number: 180, strokes: 9 },
+  { char: "頁", number: 181, strokes: 9 },
+  { char: "風", number: 182, strokes: 9 },
+  { char: "飛", number: 183, strokes: 9 },
+  { char: "食", number: 184, strokes: 9 },
+  { char: "首", number: 185, strokes: 9 },
+  { char: "香", number: 186, strokes: 9 },
+  { char: "馬", number: 187, strokes: 10 },
+  { char: "骨", number: 188, strokes: 10 },
+  { char: "高", number: 189, strokes: 10 },
+  { char: "髟", number: 190, strokes: 10 },
+  { char: "鬥", number: 191, strokes: 10 },
+  { char: "鬯", number: 192, strokes: 10 },
+  { char: "鬲", number: 193, strokes: 10 },
+  { char: "鬼", number: 194, strokes: 10 },
+  { char: "魚", number: 195, strokes: 11 },
+  { char: "鳥", number: 196, strokes: 11 },
+  { char: "鹵", number: 197, strokes: 11 },
+  { char: "鹿", number: 198, strokes: 11 },
+  { char: "麥", number: 199, strokes: 11 },
+  { char: "麻", number: 200, strokes: 11 },
+  { char: "黃", number: 201, strokes: 12 },
+  { char: "黍", number: 202, strokes: 12 },
+  { char: "黑", number: 203, strokes: 12 },
+  { char: "黹", number: 204, strokes: 12 },
+  { char: "黽", number: 205, strokes: 13 },
+  { char: "鼎", number: 206, strokes: 13 },
+  { char: "鼓", number: 207, strokes: 13 },
+  { char: "鼠", number: 208, strokes: 13 },
+  { char: "鼻", number: 209, strokes: 14 },
+  { char: "齊", number: 210, strokes: 14 },
+  { char: "齒", number: 211, strokes: 15 },
+  { char: "龍", number: 212, strokes: 16 },
+  { char: "龜", number: 213, strokes: 16 },
+  { char: "龠", number: 214, strokes: 17 },
+]
+
+// 部首字與變形 (例如 氵 扌 艹) → 部首編號
+export const CHAR_TO_RADICAL: Readonly<Record<string, number>> = {
+  "一": 1,
+  "丨": 2,
+  "丶": 3,
+  "丿": 4,
+  "乙": 5,
+  "亅": 6,
+  "二": 7,
+  "亠": 8,
+  "人": 9,
+  "儿": 10,
+  "入": 11,
+  "八": 12,
+  "冂": 13,
+  "冖": 14,
+  "冫": 15,
+  "几": 16,
+  "凵": 17,
+  "刀": 18,
+  "力": 19,
+  "勹": 20,
+  "匕": 21,
+  "匚": 22,
+  "匸": 23,
+  "十": 24,
+  "卜": 25,
+  "卩": 26,
+  "厂": 27,
+  "厶": 28,
+  "又": 29,
+  "口": 30,
+  "囗": 31,
+  "土": 32,
+  "士": 33,
+  "夂": 34,
+  "夊": 35,
+  "夕": 36,
+  "大": 37,
+  "女": 38,
+  "子": 39,
+  "宀": 40,
+  "寸": 41,
+  "小": 42,
+  "尢": 43,
+  "尸": 44,
+  "屮": 45,
+  "山": 46,
+  "巛": 47,
+  "工": 48,
+  "己": 49,
+  "巾": 50,
+  "干": 51,
+  "幺": 52,
+  "广": 53,
+  "廴": 54,
+  "廾": 55,
+  "弋": 56,
+  "弓": 57,
+  "彐": 58,
+  "彡": 59,
+  "彳": 60,
+  "心": 61,
+  "戈": 62,
+  "戶": 63,
+  "手": 64,
+  "支": 65,
+  "攴": 66,
+  "文": 67,
+  "斗": 68,
+  "斤": 69,
+  "方": 70,
+  "无": 71,
+  "日": 72,
+  "曰": 73,
+  "月": 74,
+  "木": 75,
+  "欠": 76,
+  "止": 77,
+  "歹": 78,
+  "殳": 79,
+  "毋": 80,
+  "比": 81,
+  "毛": 82,
+  "氏": 83,
+  "气": 84,
+  "水": 85,
+  "火": 86,
+  "爪": 87,
+  "父": 88,
+  "爻": 89,
+  "爿": 90,
+  "片": 91,
+  "牙": 92,
+  "牛": 93,
+  "犬": 94,
+  "玄": 95,
+  "玉": 96,
+  "瓜": 97,
+  "瓦": 98,
+  "甘": 99,
+  "生": 100,
+  "用": 101,
+  "田": 102,
+  "疋": 103,
+  "疒": 104,
+  "癶": 105,
+  "白": 106,
+  "皮": 107,
+  "皿": 108,
+  "目": 109,
+  "矛": 110,
+  "矢": 111,
+  "石": 112,
+  "示": 113,
+  "禸": 114,
+  "禾": 115,
+  "穴": 116,
+  "立": 117,
+  "竹": 118,
+  "米": 119,
+  "糸": 120,
+  "缶": 121,
+  "网": 122,
+  "羊": 123,
+  "羽": 124,
+  "老": 125,
+  "而": 126,
+  "耒": 127,
+  "耳": 128,
+  "聿": 129,
+  "肉": 130,
+  "臣": 131,
+  "自": 132,
+  "至": 133,
+  "臼": 134,
+  "舌": 135,
+  "舛": 136,
+  "舟": 137,
+  "艮": 138,
+  "色": 139,
+  "艸": 140,
+  "虍": 141,
+  "虫": 142,
+  "血": 143,
+  "行": 144,
+  "衣": 145,
+  "襾": 146,
+  "見": 147,
+  "角": 148,
+  "言": 149,
+  "谷": 150,
+  "豆": 151,
+  "豕": 152,
+  "豸": 153,
+  "貝": 154,
+  "赤": 155,
+  "走": 156,
+  "足": 157,
+  "身": 158,
+  "車": 159,
+  "辛": 160,
+  "辰": 161,
+  "辵": 162,
+  "邑": 163,
+  "酉": 164,
+  "釆": 165,
+  "里": 166,
+  "金": 167,
+  "長": 168,
+  "門": 169,
+  "阜": 170,
+  "隶": 171,
+  "隹": 172,
+  "雨": 173,
+  "靑": 174,
+  "非": 175,
+  "面": 176,
+  "革": 177,
+  "韋": 178,
+  "韭": 179,
+  "音": 180,
+  "頁": 181,
+  "風": 182,
+  "飛": 183,
+  "食": 184,
+  "首": 185,
+  "香": 186,
+  "馬": 187,
+  "骨": 188,
+  "高": 189,
+  "髟": 190,
+  "鬥": 191,
+  "鬯": 192,
+  "鬲": 193,
+  "鬼": 194,
+  "魚": 195,
+  "鳥": 196,
+  "鹵": 197,
+  "鹿": 198,
+  "麥": 199,
+  "麻": 200,
+  "黃": 201,
+  "黍": 202,
+  "黑": 203,
+  "黹": 204,
+  "黽": 205,
+  "鼎": 206,
+  "鼓": 207,
+  "鼠": 208,
+  "鼻": 209,
+  "齊": 210,
+  "齒": 211,
+  "龍": 212,
+  "龜": 213,
+  "龠": 214,
+  "⼀": 1,
+  "⼁": 2,
+  "⼂": 3,
+  "⼃": 4,
+  "⼄": 5,
+  "⼅": 6,
+  "⼆": 7,
+  "⼇": 8,
+  "⼈": 9,
+  "⼉": 10,
+  "⼊": 11,
+  "⼋": 12,
+  "⼌": 13,
+  "⼍": 14,
+  "⼎": 15,
+  "⼏": 16,
+  "⼐": 17,
+  "⼑": 18,
+  "⼒": 19,
+  "⼓": 20,
+  "⼔": 21,
+  "⼕": 22,
+  "⼖": 23,
+  "⼗": 24,
+  "⼘": 25,
+  "⼙": 26,
+  "⼚": 27,
+  "⼛": 28,
+  "⼜": 29,
+  "⼝": 30,
+  "⼞": 31,
+  "⼟": 32,
+  "⼠": 33,
+  "⼡": 34,
+  "⼢": 35,
+  "⼣": 36,
+  "⼤": 37,
+  "⼥": 38,
+  "⼦": 39,
+  "⼧": 40,
+  "⼨": 41,
+  "⼩": 42,
+  "⼪": 43,
+  "⼫": 44,
+  "⼬": 45,
+  "⼭": 46,
+  "⼮": 47,
+  "⼯": 48,
+  "⼰": 49,
+  "⼱": 50,
+  "⼲": 51,
+  "⼳": 52,
+  "⼴": 53,
+  "⼵": 54,
+  "⼶": 55,
+  "⼷": 56,
+  "⼸": 57,
+  "⼹": 58,
+  "⼺": 59,
+  "⼻": 60,
+  "⼼": 61,
+  "⼽": 62,
+  "⼾": 63,
+  "⼿": 64,
+  "⽀": 65,
+  "⽁": 66,
+  "⽂": 67,
+  "⽃": 68,
+  "⽄": 69,
+  "⽅": 70,
+  "⽆": 71,
+  "⽇": 72,
+  "⽈": 73,
+  "⽉": 74,
+  "⽊": 75,
+  "⽋": 76,
+  "⽌": 77,
+  "⽍": 78,
+  "⽎": 79,
+  "⽏": 80,
+  "⽐": 81,
+  "⽑": 82,
+  "⽒": 83,
+  "⽓": 84,
+  "⽔": 85,
+  "⽕": 86,
+  "⽖": 87,
+  "⽗": 88,
+  "⽘": 89,
+  "⽙": 90,
+  "⽚": 91,
+  "⽛": 92,
+  "⽜": 93,
+  "⽝": 94,
+  "⽞": 95,
+  "⽟": 96,
+  "⽠": 97,
+  "⽡": 98,
+  "⽢": 99,
+  "⽣": 100,
+  "⽤": 101,
+  "⽥": 102,
+  "⽦": 103,
+  "⽧": 104,
+  "⽨": 105,
+  "⽩": 106,
+  "⽪": 107,
+  "⽫": 108,
+  "⽬": 109,
+  "⽭": 110,
+  "⽮": 111,
+  "⽯": 112,
+  "⽰": 113,
+  "⽱": 114,
+  "⽲": 115,
+  "⽳": 116,
+  "⽴": 117,
+  "⽵": 118,
+  "⽶": 119,
+  "⽷": 120,
+  "⽸": 121,
+  "⽹": 122,
+  "⽺": 123,
+  "⽻": 124,
+  "⽼": 125,
+  "⽽": 126,
+  "⽾": 127,
+  "⽿": 128,
+  "⾀": 129,
+  "⾁": 130,
+  "⾂": 131,
+  "⾃": 132,
+  "⾄": 133,
+  "⾅": 134,
+  "⾆": 135,
+  "⾇": 136,
+  "⾈": 137,
+  "⾉": 138,
+  "⾊": 139,
+  "⾋": 140,
+  "⾌": 141,
+  "⾍": 142,
+  "⾎": 143,
+  "⾏": 144,
+  "⾐": 145,
+  "⾑": 146,
+  "⾒": 147,
+  "⾓": 148,
+  "⾔": 149,
+  "⾕": 150,
+  "⾖": 151,
+  "⾗": 152,
+  "⾘": 153,
+  "⾙": 154,
+  "⾚": 155,
+  "⾛": 156,
+  "⾜": 157,
+  "⾝": 158,
+  "⾞": 159,
+  "⾟": 160,
+  "⾠": 161,
+  "⾡": 162,
+  "⾢": 163,
+  "⾣": 164,
+  "⾤": 165,
+  "⾥": 166,
+  "⾦": 167,
+  "⾧": 168,
+  "⾨": 169,
+  "⾩": 170,
+  "⾪": 171,
+  "⾫": 172,
+  "⾬": 173,
+  "⾭": 174,
+  "⾮": 175,
+  "⾯": 176,
+  "⾰": 177,
+  "⾱": 178,
+  "⾲": 179,
+  "⾳": 180,
+  "⾴": 181,
+  "⾵": 182,
+  "⾶": 183,
+  "⾷": 184,
+  "⾸": 185,
+  "⾹": 186,
+  "⾺": 187,
+  "⾻": 188,
+  "⾼": 189,
+  "⾽": 190,
+  "⾾": 191,
+  "⾿": 192,
+  "⿀": 193,
+  "⿁": 194,
+  "⿂": 195,
+  "⿃": 196,
+  "⿄": 197,
+  "⿅": 198,
+  "⿆": 199,
+  "⿇": 200,
+  "⿈": 201,
+  "⿉": 202,
+  "⿊": 203,
+  "⿋": 204,
+  "⿌": 205,
+  "⿍": 206,
+  "⿎": 207,
+  "⿏": 208,
+  "⿐": 209,
+  "⿑": 210,
+  "⿒": 211,
+  "⿓": 212,
+  "⿔": 213,
+  "⿕": 214,
+  "乚": 5,
+  "乛": 5,
+  "亻": 9,
+  "刂": 18,
+  "㔾": 26,
+  "尣": 43,
+  "彑": 58,
+  "忄": 61,
+  "㣺": 61,
+  "户": 63,
+  "戸": 63,
+  "扌": 64,
+  "攵": 66,
+  "旡": 71,
+  "歺": 78,
+  "氵": 85,
+  "氺": 85,
+  "灬": 86,
+  "爫": 87,
+  "丬": 90,
+  "牜": 93,
+  "犭": 94,
+  "王": 96,
+  "礻": 113,
+  "糹": 120,
+  "纟": 120,
+  "罒": 122,
+  "罓": 122,
+  "耂": 125,
+  "肀": 129,
+  "⺼": 130,
+  "艹": 140,
+  "衤": 145,
+  "西": 146,
+  "覀": 146,
+  "见": 147,
+  "讠": 149,
+  "贝": 154,
+  "车": 159,
+  "辶": 162,
+  "⻌": 162,
+  "⻍": 162,
+  "釒": 167,
+  "钅": 167,
+  "长": 168,
+  "镸": 168,
+  "门": 169,
+  "青": 174,
+  "页": 181,
+  "风": 182,
+  "飞": 183,
+  "飠": 184,
+  "饣": 184,
+  "马": 187,
+  "鱼": 195,
+  "鸟": 196,
+  "卤": 197,
+  "麦": 199,
+  "黄": 201,
+  "黾": 205,
+  "齐": 210,
+  "齿": 211,
+  "龙": 212,
+  "龟": 213,
+}
+
+// 筆劃數 → 部首列表 (索引 0 不使用)
+export const RADICALS_BY_STROKES: readonly (readonly Radical[])[] = [
+  [],
+  [RADICALS[1], RADICALS[2], RADICALS[3], RADICALS[4], RADICALS[5], RADICALS[6]],
+  [RADICALS[7], RADICALS[8], RADICALS[9], RADICALS[10], RADICALS[11], RADICALS[12], RADICALS[13], RADICALS[14], RADICALS[15], RADICALS[16], RADICALS[17], RADICALS[18], RADICALS[19], RADICALS[20], RADICALS[21], RADICALS[22], RADICALS[23], RADICALS[24], RADICALS[25], RADICALS[26], RADICALS[27], RADICALS[28], RADICALS[29]],
+  [RADICALS[30], RADICALS[31], RADICALS[32], RADICALS[33], RADICALS[34], RADICALS[35], RADICALS[36], RADICALS[37], RADICALS[38], RADICALS[39], RADICALS[40], RADICALS[41], RADICALS[42], RADICALS[43], RADICALS[44], RADICALS[45], RADICALS[46], RADICALS[47], RADICALS[48], RADICALS[49], RADICALS[50], RADICALS[51], RADICALS[52], RADICALS[53], RADICALS[54], RADICALS[55], RADICALS[56], RADICALS[57], RADICALS[58], RADICALS[59], RADICALS[60]],
+  [RADICALS[61], RADICALS[62], RADICALS[63], RADICALS[64], RADICALS[65], RADICALS[66], RADICALS[67], RADICALS[68], RADICALS[69], RADICALS[70], RADICALS[71], RADICALS[72], RADICALS[73], RADICALS[74], RADICALS[75], RADICALS[76], RADICALS[77], RADICALS[78], RADICALS[79], RADICALS[80], RADICALS[81], RADICALS[82], RADICALS[83], RADICALS[84], RADICALS[85], RADICALS[86], RADICALS[87], RADICALS[88], RADICALS[89], RADICALS[90], RADICALS[91], RADICALS[92], RADICALS[93], RADICALS[94]],
+  [RADICALS[95], RADICALS[96], RADICALS[97], RADICALS[98], RADICALS[99], RADICALS[100], RADICALS[101], RADICALS[102], RADICALS[103], RADICALS[104], RADICALS[105], RADICALS[106], RADICALS[107], RADICALS[108], RADICALS[109], RADICALS[110], RADICALS[111], RADICALS[112], RADICALS[113], RADICALS[114], RADICALS[115], RADICALS[116], RADICALS[117]],
+  [RADICALS[118], RADICALS[119], RADICALS[120], RADICALS[121], RADICALS[122], RADICALS[123], RADICALS[124], RADICALS[125], RADICALS[126], RADICALS[127], RADICALS[128], RADICALS[129], RADICALS[130], RADICALS[131], RADICALS[132], RADICALS[133], RADICALS[134], RADICALS[135], RADICALS[136], RADICALS[137], RADICALS[138], RADICALS[139], RADICALS[140], RADICALS[141], RADICALS[142], RADICALS[143], RADICALS[144], RADICALS[145], RADICALS[146]],
+  [RADICALS[147], RADICALS[148], RADICALS[149], RADICALS[150], RADICALS[151], RADICALS[152], RADICALS[153], RADICALS[154], RADICALS[155], RADICALS[156], RADICALS[157], RADICALS[158], RADICALS[159], RADICALS[160], RADICALS[161], RADICALS[162], RADICALS[163], RADICALS[164], RADICALS[165], RADICALS[166]],
+  [RADICALS[167], RADICALS[168], RADICALS[169], RADICALS[170], RADICALS[171], RADICALS[172], RADICALS[173], RADICALS[174], RADICALS[175]],
+  [RADICALS[176], RADICALS[177], RADICALS[178], RADICALS[179], RADICALS[180], RADICALS[181], RADICALS[182], RADICALS[183], RADICALS[184], RADICALS[185], RADICALS[186]],
+  [RADICALS[187], RADICALS[188], RADICALS[189], RADICALS[190], RADICALS[191], RADICALS[192], RADICALS[193], RADICALS[194]],
+  [RADICALS[195], RADICALS[196], RADICALS[197], RADICALS[198], RADICALS[199], RADICALS[200]],
+  [RADICALS[201], RADICALS[202], RADICALS[203], RADICALS[204]],
+  [RADICALS[205], RADICALS[206], RADICALS[207], RADICALS[208]],
+  [RADICALS[209], RADICALS[210]],
+  [RADICALS[211]],
+  [RADICALS[212], RADICALS[213]],
+  [RADICALS[214]],
+]
+
+// 有部首的筆劃數
+export const STROKE_COUNTS: readonly number[] = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17]
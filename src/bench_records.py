@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+比較舊的字典流程與 Video → TitleInfo → CalligraphyVideo 記錄流程的記憶體用量
+
+以 calligraphy_videos.csv 中的字與部首產生合成標題，模擬 main() 的處理：
+保留 API 回傳的影片清單與處理後的書法影片清單。部首以 CSV 查表取代 Cihai，
+兩個流程使用相同的查表，只比較資料結構本身。
+
+用法:
+    python -m src.bench_records --titles 1000000
+"""
+
+import argparse
+import csv
+import gc
+import re
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.extract_calligraphy_videos import extract_info_from_title
+from src.models import CalligraphyVideo, Video, parse_radical
+
+ROOT_DIR = Path(__file__).parent.parent
+CSV_PATH = ROOT_DIR / "calligraphy_videos.csv"
+
+
+def legacy_extract_info_from_title(title: str) -> Optional[Dict[str, str]]:
+    """改用 TitleInfo 之前的 extract_info_from_title (返回字典)，作為比較基準"""
+    match1 = re.search(r'趙孟頫\s+每日一字\s+(\d+)([^\s~]+)~全集(\d+)篇', title)
+    if match1:
+        return {
+            'volume': match1.group(3).lstrip('0'),
+            'sequence': match1.group(1),
+            'character': match1.group(2)
+        }
+    match3 = re.search(r'趙孟頫\s+每日一字\s+(\d+)([^\s~]+)~', title)
+    if match3:
+        return {'volume': '0', 'sequence': match3.group(1), 'character': match3.group(2)}
+    match2 = re.search(r'趙孟頫\s+每日一字\s+(\d+)([^\s]+)', title)
+    if match2:
+        return {'volume': '0', 'sequence': match2.group(1), 'character': match2.group(2)}
+    return None
+
+
+def load_samples(csv_path: Path = CSV_PATH):
+    """從 CSV 取得 (篇, 中文字) 樣本與 中文字 → 部首 對照表"""
+    samples = []
+    radicals = {}
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        for row in reader:
+            samples.append((row[0], row[2]))
+            radicals[row[2]] = row[3]
+    return samples, radicals
+
+
+def make_api_response(count: int, samples) -> List[tuple]:
+    """產生合成的 (影片 ID, 標題)，每次呼叫都產生新的字串物件，如同 JSON 解析的結果"""
+    response = []
+    for i in range(count):
+        volume, character = samples[i % len(samples)]
+        title = f"趙孟頫 每日一字 {i % 10000:04d}{character}~全集{int(volume):02d}篇"
+        response.append((f"v{i:010d}", title))
+    return response
+
+
+def run_legacy(response, radicals):
+    videos = [{'id': video_id, 'title': title} for video_id, title in response]
+    calligraphy_videos = []
+    for video in videos:
+        info = legacy_extract_info_from_title(video['title'])
+        if info:
+            calligraphy_videos.append({
+                'volume': info['volume'],
+                'sequence': info['sequence'],
+                'character': info['character'],
+                'radical': radicals.get(info['character'], ''),
+                'url': f"https://www.youtube.com/watch?v={video['id']}"
+            })
+    return videos, calligraphy_videos
+
+
+def run_records(response, radicals):
+    videos = [Video(video_id, title) for video_id, title in response]
+    calligraphy_videos = []
+    for video in videos:
+        info = extract_info_from_title(video.title)
+        if info:
+            radical = parse_radical(radicals.get(info.character, ''))
+            calligraphy_videos.append(CalligraphyVideo.from_title_info(info, radical, video.id))
+    return videos, calligraphy_videos
+
+
+def measure(pipeline, response, radicals) -> Dict[str, float]:
+    """回傳保留的記憶體、區塊數 (每個標題) 與峰值、耗時"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = pipeline(response, radicals)
+    elapsed = time.perf_counter() - start
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = snapshot.statistics("filename")
+    size = sum(stat.size for stat in stats)
+    blocks = sum(stat.count for stat in stats)
+    count = len(response)
+    del result
+    return {
+        "bytes_per_title": size / count,
+        "blocks_per_title": blocks / count,
+        "peak_mb": peak / 1024 / 1024,
+        "seconds": elapsed,
+    }
+
+
+def main():
+    """主函數"""
+    parser = argparse.ArgumentParser(description="記錄型別記憶體用量比較")
+    parser.add_argument("--titles", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    samples, radicals = load_samples()
+    response = make_api_response(args.titles, samples)
+
+    print(f"合成標題數: {args.titles:,}")
+    print(f"{'流程':<10}{'bytes/標題':>12}{'區塊/標題':>12}{'峰值(MB)':>12}{'秒':>8}")
+    for name, pipeline in (("dict", run_legacy), ("records", run_records)):
+        result = measure(pipeline, response, radicals)
+        print(f"{name:<10}{result['bytes_per_title']:>12.1f}{result['blocks_per_title']:>12.2f}"
+              f"{result['peak_mb']:>12.1f}{result['seconds']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 import os
 import re
 
-def load_config():
-    """載入 .env 檔案中的環境變數"""
+def _load_env():
+    """將 .env 檔案中的設定載入環境變數"""
     # 直接讀取 .env 檔案
     env_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
     
@@ -13,6 +13,10 @@ def load_config():
                 if line and not line.startswith('#'):
                     key, value = line.split('=', 1)
                     os.environ[key.strip()] = value.strip().strip('"\'')
+
+def load_config():
+    """載入 .env 檔案中的環境變數"""
+    _load_env()
     
     api_key = os.getenv("YOUTUBE_API_KEY")
     channel_id = os.getenv("TARGET_CHANNEL_ID")
@@ -24,6 +28,16 @@ def load_config():
 
     return {"api_key": api_key, "channel_id": channel_id}
 
+def load_channel_id():
+    """只載入頻道 ID，給不需要呼叫 YouTube API 的程式使用 (例如 WebSub 接收服務)"""
+    _load_env()
+
+    channel_id = os.getenv("TARGET_CHANNEL_ID")
+    if not channel_id:
+        raise ValueError("請在 .env 檔案中設定 TARGET_CHANNEL_ID")
+
+    return channel_id
+
 # --- 或者 ---
 
 # `src/config_loader.py` (如果使用 `config.yaml`)
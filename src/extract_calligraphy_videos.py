@@ -8,11 +8,14 @@
 import re
 import csv
 import os
-from typing import List, Dict, Tuple, Optional
+from typing import List, Tuple, Optional
 from cihai.core import Cihai
 
 from src.config_loader import load_config
 from src.youtube_api import get_channel_videos
+from src.models import TitleInfo, CalligraphyVideo, parse_radical
+from src.radicals import CHAR_TO_RADICAL
+from src.sequence_check import CSV_PATH, REPORT_PATH, analyze_sequences, load_videos_frame, print_summary, write_report
 
 def init_cihai() -> Cihai:
     """初始化 Cihai 以獲取漢字部首"""
@@ -21,7 +24,7 @@ def init_cihai() -> Cihai:
         c.unihan.bootstrap()
     return c
 
-def extract_info_from_title(title: str) -> Optional[Dict[str, str]]:
+def extract_info_from_title(title: str) -> Optional[TitleInfo]:
     """
     從影片標題中提取資訊
     
@@ -29,7 +32,7 @@ def extract_info_from_title(title: str) -> Optional[Dict[str, str]]:
         title: 影片標題，例如 "趙孟頫 每日一字 1423閶~全集09篇" 或 "趙孟頫 每日一字 0001一" 或 "趙孟頫 每日一字 0010既~xxxxxx"
         
     Returns:
-        包含篇號、序號、中文字的字典，如果不符合格式則返回 None
+        包含篇號、序號、中文字的 TitleInfo，如果不符合格式則返回 None
     """
     # 使用正則表達式匹配標題格式 1: "趙孟頫 每日一字 1423閶~全集09篇"
     pattern1 = r'趙孟頫\s+每日一字\s+(\d+)([^\s~]+)~全集(\d+)篇'
@@ -43,11 +46,7 @@ def extract_info_from_title(title: str) -> Optional[Dict[str, str]]:
         # 移除前導零
         volume_number = volume_number.lstrip('0')
         
-        return {
-            'volume': volume_number,
-            'sequence': sequence_number,
-            'character': chinese_char
-        }
+        return TitleInfo(volume_number, sequence_number, chinese_char)
     
     # 使用正則表達式匹配標題格式 3: "趙孟頫 每日一字 0010既~xxxxxx"
     pattern3 = r'趙孟頫\s+每日一字\s+(\d+)([^\s~]+)~'
@@ -57,11 +56,8 @@ def extract_info_from_title(title: str) -> Optional[Dict[str, str]]:
         sequence_number = match3.group(1)  # 序號，例如 "0010"
         chinese_char = match3.group(2)     # 中文字，例如 "既"
         
-        return {
-            'volume': '0',  # 對於沒有篇號的影片，設置為 0
-            'sequence': sequence_number,
-            'character': chinese_char
-        }
+        # 對於沒有篇號的影片，篇號設置為 0
+        return TitleInfo('0', sequence_number, chinese_char)
     
     # 使用正則表達式匹配標題格式 2: "趙孟頫 每日一字 0001一"
     pattern2 = r'趙孟頫\s+每日一字\s+(\d+)([^\s]+)'
@@ -71,11 +67,8 @@ def extract_info_from_title(title: str) -> Optional[Dict[str, str]]:
         sequence_number = match2.group(1)  # 序號，例如 "0001"
         chinese_char = match2.group(2)     # 中文字，例如 "一"
         
-        return {
-            'volume': '0',  # 對於沒有篇號的影片，設置為 0
-            'sequence': sequence_number,
-            'character': chinese_char
-        }
+        # 對於沒有篇號的影片，篇號設置為 0
+        return TitleInfo('0', sequence_number, chinese_char)
     
     return None
 
@@ -90,6 +83,10 @@ def get_radical(c: Cihai, character: str) -> str:
     Returns:
         部首編號字符串
     """
+    # 部首字本身及其變形 (例如 氵 扌 艹) 直接查表，不需查詢 Unihan
+    if character in CHAR_TO_RADICAL:
+        return str(CHAR_TO_RADICAL[character])
+
     try:
         query = c.unihan.lookup_char(character)
         if query:
@@ -108,16 +105,15 @@ def get_radical(c: Cihai, character: str) -> str:
                         if rs_unicode:
                             radical_number = rs_unicode.split('.')[0]
                         
-                        # 直接返回部首編號
-                        return radical_number
+                        # 直接返回部首編號 (簡化部首如 "147'" 去掉 ' 後編號相同)
+                        return radical_number.rstrip("'")
                 elif hasattr(query_list[0], '__dict__'):
                     # 如果是對象，嘗試獲取屬性
                     for attr_name in ['kRSKangXi', 'kRSUnicode']:
                         if hasattr(query_list[0], attr_name):
                             rs_info = getattr(query_list[0], attr_name)
                             if rs_info:
-                                radical_number = rs_info.split('.')[0]
-                                return radical_number
+                                return rs_info.split('.')[0].rstrip("'")
     except Exception as e:
         print(f"獲取部首時發生錯誤: {e}")
             
@@ -138,7 +134,7 @@ def main():
         
         # 3. 獲取頻道影片
         print(f"正在從頻道 {channel_id} 獲取影片...")
-        videos = get_channel_videos(api_key, channel_id)
+        videos = get_channel_videos(api_key, channel_id, lean=True)
         
         if not videos:
             print("無法獲取影片資訊，程式結束。")
@@ -147,44 +143,38 @@ def main():
         # 4. 處理影片資訊
         print("開始處理影片資訊...")
         calligraphy_videos = []
+        unparsed = []
         
         for video in videos:
-            video_id = video['id']
-            title = video['title']
-            info = extract_info_from_title(title)
+            info = extract_info_from_title(video.title)
             
             if info:
                 # 獲取漢字部首
-                radical = get_radical(c, info['character'])
+                radical = parse_radical(get_radical(c, info.character))
                 
                 # 添加到結果列表
-                calligraphy_videos.append({
-                    'volume': info['volume'],
-                    'sequence': info['sequence'],
-                    'character': info['character'],
-                    'radical': radical,
-                    'url': f"https://www.youtube.com/watch?v={video_id}"
-                })
+                calligraphy_videos.append(CalligraphyVideo.from_title_info(info, radical, video.id))
+            else:
+                unparsed.append(video)
         
         # 5. 輸出 CSV 檔案
         if calligraphy_videos:
-            output_file = "calligraphy_videos.csv"
+            output_file = CSV_PATH
             with open(output_file, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
                 # 寫入標題列
                 writer.writerow(['篇', '序號', '中文字', '中文字部首', '影片網址'])
                 
                 # 寫入資料
-                for video in calligraphy_videos:
-                    writer.writerow([
-                        video['volume'],
-                        video['sequence'],
-                        video['character'],
-                        video['radical'],
-                        video['url']
-                    ])
+                writer.writerows(video.to_csv_row() for video in calligraphy_videos)
             
             print(f"成功處理 {len(calligraphy_videos)} 部書法影片，結果已儲存至 {output_file}")
+
+            # 6. 檢查序號缺漏與重複，並記錄無法解析的標題
+            # 已抓取整個頻道，缺少的序號都已確認；無法解析的影片留給 --repair 重新抓取一次
+            analysis = analyze_sequences(load_videos_frame(output_file))
+            report = write_report(analysis, unparsed, REPORT_PATH, analysis['missing'])
+            print_summary(report)
         else:
             print("未找到符合格式的書法影片。")
             
@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+由 process_radicals.radical_map 產生部首查詢表
+
+輸出兩個檔案 (請勿手動修改，修改後重新執行本程式)：
+  - src/radicals.py: 給 get_radical 等 Python 程式使用
+  - frontend/src/lib/radicals.ts: 給前端使用
+
+用法:
+    python -m src.generate_radicals
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+from src.process_radicals import radical_map
+
+ROOT_DIR = Path(__file__).parent.parent
+PYTHON_OUTPUT = ROOT_DIR / "src" / "radicals.py"
+TYPESCRIPT_OUTPUT = ROOT_DIR / "frontend" / "src" / "lib" / "radicals.ts"
+
+# Unicode 康熙部首區塊 (U+2F00 ⼀ … U+2FD5 ⿕) 依部首編號排列
+KANGXI_RADICALS_START = 0x2F00
+
+# 部首的變形、簡化字形與常見異體，對應到康熙部首編號
+# 阝 左右兩側分屬阜 (170)、邑 (163)，無法單憑字形判斷，故不列入
+VARIANT_FORMS = {
+    "乚": 5, "乛": 5,
+    "亻": 9,
+    "刂": 18,
+    "㔾": 26,
+    "尣": 43,
+    "彑": 58,
+    "忄": 61, "㣺": 61,
+    "户": 63, "戸": 63,
+    "扌": 64,
+    "攵": 66,
+    "旡": 71,
+    "歺": 78,
+    "氵": 85, "氺": 85,
+    "灬": 86,
+    "爫": 87,
+    "丬": 90,
+    "牜": 93,
+    "犭": 94,
+    "王": 96,
+    "礻": 113,
+    "糹": 120, "纟": 120,
+    "罒": 122, "罓": 122,
+    "耂": 125,
+    "肀": 129,
+    "⺼": 130,
+    "艹": 140,
+    "衤": 145,
+    "西": 146, "覀": 146,
+    "见": 147,
+    "讠": 149,
+    "贝": 154,
+    "车": 159,
+    "辶": 162, "⻌": 162, "⻍": 162,
+    "釒": 167, "钅": 167,
+    "长": 168, "镸": 168,
+    "门": 169,
+    "青": 174,
+    "页": 181,
+    "风": 182,
+    "飞": 183,
+    "飠": 184, "饣": 184,
+    "马": 187,
+    "鱼": 195,
+    "鸟": 196,
+    "卤": 197,
+    "麦": 199,
+    "黄": 201,
+    "黾": 205,
+    "齐": 210,
+    "齿": 211,
+    "龙": 212,
+    "龟": 213,
+}
+
+
+def build_tables() -> Dict[str, object]:
+    """
+    建立雙向查詢表
+
+    Returns:
+        chars / strokes: 以部首編號為索引的 list (索引 0 不使用)
+        char_to_number: 部首字、變形與康熙部首區塊字元 → 部首編號
+        by_strokes: 以筆劃數為索引的部首編號 list (索引 0 不使用)
+    """
+    count = len(radical_map)
+    chars: List[str] = [""] * (count + 1)
+    strokes: List[int] = [0] * (count + 1)
+    for char, info in radical_map.items():
+        chars[info["number"]] = char
+        strokes[info["number"]] = info["strokes"]
+
+    if "" in chars[1:]:
+        raise ValueError("radical_map 的部首編號不連續")
+
+    char_to_number = {char: number for number, char in enumerate(chars) if number}
+    for number in range(1, count + 1):
+        char_to_number.setdefault(chr(KANGXI_RADICALS_START + number - 1), number)
+    for char, number in VARIANT_FORMS.items():
+        if char_to_number.setdefault(char, number) != number:
+            raise ValueError(f"變形 {char} 與既有部首衝突")
+
+    max_strokes = max(strokes)
+    by_strokes: List[List[int]] = [[] for _ in range(max_strokes + 1)]
+    for number in range(1, count + 1):
+        by_strokes[strokes[number]].append(number)
+
+    return {
+        "chars": chars,
+        "strokes": strokes,
+        "char_to_number": char_to_number,
+        "by_strokes": by_strokes,
+    }
+
+
+def render_python(tables: Dict[str, object]) -> str:
+    """產生 src/radicals.py 的內容"""
+    chars = tables["chars"]
+    char_to_number = tables["char_to_number"]
+    lines = [
+        "# -*- coding: utf-8 -*-",
+        '"""',
+        "部首查詢表 (由 src/generate_radicals.py 產生，請勿手動修改)",
+        "",
+        "所有查詢皆為 O(1)：以部首編號或筆劃數作為 tuple 索引，以字元查 dict。",
+        '"""',
+        "",
+        "from typing import Optional, Tuple",
+        "",
+        "# 部首編號 → 部首字 (索引 0 不使用)",
+        "RADICAL_CHARS = (",
+    ]
+    lines += [f"    {json.dumps(char, ensure_ascii=False)},  # {number}" for number, char in enumerate(chars)]
+    lines += [
+        ")",
+        "",
+        "# 部首編號 → 筆劃數 (索引 0 不使用)",
+        "RADICAL_STROKES = (",
+    ]
+    strokes = tables["strokes"]
+    for start in range(0, len(strokes), 20):
+        lines.append("    " + ", ".join(str(s) for s in strokes[start:start + 20]) + ",")
+    lines += [
+        ")",
+        "",
+        "# 筆劃數 → 部首編號 (索引 0 不使用)",
+        "RADICALS_BY_STROKES = (",
+    ]
+    for count, numbers in enumerate(tables["by_strokes"]):
+        tail = "," if len(numbers) == 1 else ""
+        lines.append(f"    ({', '.join(str(n) for n in numbers)}{tail}),  # {count}")
+    lines += [
+        ")",
+        "",
+        "# 部首字、變形 (例如 氵 扌 艹) 與康熙部首區塊字元 → 部首編號",
+        "CHAR_TO_RADICAL = {",
+    ]
+    lines += [f"    {json.dumps(char, ensure_ascii=False)}: {number},"
+              for char, number in char_to_number.items()]
+    lines += [
+        "}",
+        "",
+        "",
+        "def radical_number(char: str) -> Optional[int]:",
+        '    """由部首字或其變形取得部首編號，不是部首則返回 None"""',
+        "    return CHAR_TO_RADICAL.get(char)",
+        "",
+        "",
+        "def radical_char(number: int) -> str:",
+        '    """由部首編號取得部首字"""',
+        "    return RADICAL_CHARS[number]",
+        "",
+        "",
+        "def radical_strokes(number: int) -> int:",
+        '    """由部首編號取得筆劃數"""',
+        "    return RADICAL_STROKES[number]",
+        "",
+        "",
+        "def radicals_by_strokes(strokes: int) -> Tuple[int, ...]:",
+        '    """取得指定筆劃數的所有部首編號"""',
+        "    if 0 < strokes < len(RADICALS_BY_STROKES):",
+        "        return RADICALS_BY_STROKES[strokes]",
+        "    return ()",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def render_typescript(tables: Dict[str, object]) -> str:
+    """產生 frontend/src/lib/radicals.ts 的內容"""
+    chars = tables["chars"]
+    strokes = tables["strokes"]
+    lines = [
+        "// 部首查詢表 (由 src/generate_radicals.py 產生，請勿手動修改)",
+        "",
+        "export interface Radical {",
+        "  char: string",
+        "  number: number",
+        "  strokes: number",
+        "}",
+        "",
+        "// 部首編號 → 部首資料 (索引 0 不使用)",
+        "export const RADICALS: readonly Radical[] = [",
+        "  { char: '', number: 0, strokes: 0 },",
+    ]
+    lines += [f"  {{ char: {json.dumps(chars[n], ensure_ascii=False)}, number: {n}, strokes: {strokes[n]} }},"
+              for n in range(1, len(chars))]
+    lines += [
+        "]",
+        "",
+        "// 部首字與變形 (例如 氵 扌 艹) → 部首編號",
+        "export const CHAR_TO_RADICAL: Readonly<Record<string, number>> = {",
+    ]
+    lines += [f"  {json.dumps(char, ensure_ascii=False)}: {number},"
+              for char, number in tables["char_to_number"].items()]
+    lines += [
+        "}",
+        "",
+        "// 筆劃數 → 部首列表 (索引 0 不使用)",
+        "export const RADICALS_BY_STROKES: readonly (readonly Radical[])[] = [",
+    ]
+    for numbers in tables["by_strokes"]:
+        lines.append(f"  [{', '.join(f'RADICALS[{n}]' for n in numbers)}],")
+    lines += [
+        "]",
+        "",
+        "// 有部首的筆劃數",
+        f"export const STROKE_COUNTS: readonly number[] = "
+        f"[{', '.join(str(count) for count, numbers in enumerate(tables['by_strokes']) if numbers)}]",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def main():
+    """主函數"""
+    tables = build_tables()
+    PYTHON_OUTPUT.write_text(render_python(tables), encoding="utf-8")
+    TYPESCRIPT_OUTPUT.write_text(render_typescript(tables), encoding="utf-8")
+    print(f"已產生 {PYTHON_OUTPUT} 與 {TYPESCRIPT_OUTPUT}")
+    print(f"共 {len(tables['chars']) - 1} 個部首，{len(tables['char_to_number'])} 個可查詢字元")
+
+
+if __name__ == "__main__":
+    main()
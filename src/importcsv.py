@@ -4,6 +4,8 @@ from dotenv import load_dotenv
 import os
 from pathlib import Path
 
+from src.models import CalligraphyVideo
+
 # 獲取專案根目錄
 ROOT_DIR = Path(__file__).parent.parent
 print(f"專案根目錄: {ROOT_DIR}")
@@ -56,33 +58,30 @@ except Exception as e:
 csv_path = ROOT_DIR / "calligraphy_videos.csv"
 print(f"正在讀取 CSV 文件: {csv_path}")
 try:
-    df = pd.read_csv(csv_path)
+    # 以字串讀取，保留序號的前導零，空白部首讀成空字串
+    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
     print(f"成功讀取 CSV，共 {len(df)} 筆資料")
 except Exception as e:
     print(f"讀取 CSV 失敗：{str(e)}")
     raise
 
-# 將 DataFrame 欄位名稱轉為英文，符合資料庫欄位
-df.rename(columns={
-    "篇": "chapter",
-    "序號": "serial",
-    "中文字": "character",
-    "中文字部首": "radical",
-    "影片網址": "video_url"
-}, inplace=True)
-
-# 清理數據：將 nan 值替換為 None
-df = df.where(pd.notnull(df), None)
-
-# 將 radical 欄位轉換為整數，無效值設為 None
-df['radical'] = pd.to_numeric(df['radical'], errors='coerce').astype('Int64')
+# 將每一列轉換為 CalligraphyVideo 記錄 (部首轉為整數，無效值設為 None)
+# 欄位順序：篇, 序號, 中文字, 中文字部首, 影片網址
+data = [
+    CalligraphyVideo.from_csv_row(*row)
+    for row in df[["篇", "序號", "中文字", "中文字部首", "影片網址"]].itertuples(index=False, name=None)
+]
 
 # 檢查一下資料是否正確
 print("\n資料預覽：")
-print(df.head())
+for record in data[:5]:
+    try:
+        print(record.to_record())
+    except ValueError as e:
+        # 格式錯誤的資料在上傳時會記為失敗，不中斷匯入
+        print(f"資料格式錯誤：{record} ({str(e)})")
 
 # 上傳資料到 Supabase
-data = df.to_dict(orient="records")
 print(f"\n準備上傳 {len(data)} 筆資料...")
 
 # 逐筆插入 Supabase 資料表
@@ -91,7 +90,7 @@ error_count = 0
 
 for i, item in enumerate(data, 1):
     try:
-        res = supabase.table("characters").insert(item).execute()
+        res = supabase.table("characters").insert(item.to_record()).execute()
         success_count += 1
         if i % 100 == 0:  # 每100筆顯示一次進度
             print(f"已成功上傳 {success_count} 筆資料...")
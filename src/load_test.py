@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+重播前端查詢模式，對 characters 資料表的讀取路徑做壓力測試
+
+模擬 App.tsx 的兩種查詢：
+  - 字元搜尋：每次輸入都送出 character ilike '%字%' limit 10
+  - 部首搜尋：點選部首後送出 radical = 編號 limit 10
+
+中文字依 calligraphy_videos.csv 中出現的頻率抽樣 (另有一定比例查無此字)，
+部首取自 radical_map，依 CSV 中各部首的字數加權。
+結果輸出 p50/p95/p99 延遲與吞吐量，方便比較索引或快取調整前後的差異。
+
+用法:
+    python -m src.load_test --rest-url http://localhost:54321/rest/v1 --concurrency 8 --requests 2000
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.process_radicals import radical_map
+
+ROOT_DIR = Path(__file__).parent.parent
+CSV_PATH = ROOT_DIR / "calligraphy_videos.csv"
+
+# 查無此字時使用的常見字 (不在書法影片中的字會在執行時過濾)
+MISS_CANDIDATES = "的我你他們這那是在有和了不要會說來去好看想做到上下"
+
+
+def load_query_pool(csv_path: Path = CSV_PATH) -> Tuple[List[str], List[int], List[int], List[int]]:
+    """
+    從 CSV 建立查詢用的中文字與部首，以及各自的抽樣權重
+
+    Returns:
+        (中文字, 中文字權重, 部首編號, 部首權重)
+    """
+    characters = Counter()
+    radicals = Counter()
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)  # 跳過標題列
+        for row in reader:
+            characters[row[2]] += 1
+            if row[3].isdigit():
+                radicals[int(row[3])] += 1
+
+    # 介面上所有部首都可點選，沒有字的部首也給最小權重
+    radical_numbers = [info["number"] for info in radical_map.values()]
+    radical_weights = [radicals[number] + 1 for number in radical_numbers]
+    return list(characters), list(characters.values()), radical_numbers, radical_weights
+
+
+class QueryMix:
+    """依設定比例產生查詢 (種類, PostgREST 查詢字串)"""
+
+    def __init__(self, csv_path: Path, radical_ratio: float, miss_ratio: float, seed: Optional[int] = None):
+        self.characters, self.character_weights, self.radicals, self.radical_weights = load_query_pool(csv_path)
+        known = set(self.characters)
+        self.misses = [ch for ch in MISS_CANDIDATES if ch not in known] or ["龘"]
+        self.radical_ratio = radical_ratio
+        self.miss_ratio = miss_ratio
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def next(self) -> Tuple[str, str]:
+        with self.lock:
+            if self.random.random() < self.radical_ratio:
+                number = self.random.choices(self.radicals, self.radical_weights)[0]
+                return "radical", f"select=*&radical=eq.{number}&limit=10"
+            if self.random.random() < self.miss_ratio:
+                kind, character = "miss", self.random.choice(self.misses)
+            else:
+                kind = "character"
+                character = self.random.choices(self.characters, self.character_weights)[0]
+        pattern = urllib.parse.quote(f"*{character}*")
+        return kind, f"select=*&character=ilike.{pattern}&limit=10"
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """nearest-rank 百分位數"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct * len(sorted_values) / 100) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """將延遲 (秒) 整理為毫秒統計"""
+    values = sorted(latencies)
+    return {
+        "count": len(values),
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "max_ms": (values[-1] * 1000) if values else 0.0,
+    }
+
+
+def run_load_test(rest_url: str, api_key: Optional[str], mix: QueryMix, concurrency: int,
+                  total_requests: int, timeout: float = 10.0) -> dict:
+    """
+    以指定併發數送出 total_requests 個查詢
+
+    Returns:
+        包含整體與各查詢種類延遲統計、吞吐量與錯誤數的字典
+    """
+    endpoint = rest_url.rstrip("/") + "/characters"
+    headers = {"Accept": "application/json"}
+    if api_key:
+        headers["apikey"] = api_key
+        headers["Authorization"] = f"Bearer {api_key}"
+
+    results: List[Tuple[str, float, bool]] = []
+    errors: List[str] = []
+    results_lock = threading.Lock()
+
+    def worker(count: int) -> None:
+        local = []
+        for _ in range(count):
+            kind, query = mix.next()
+            request = urllib.request.Request(f"{endpoint}?{query}", headers=headers)
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request, timeout=timeout) as response:
+                    response.read()
+                ok = True
+            except (urllib.error.URLError, OSError) as e:
+                ok = False
+                errors.append(str(e))
+            local.append((kind, time.perf_counter() - start, ok))
+        with results_lock:
+            results.extend(local)
+
+    # 平均分配請求數給每個 worker
+    shares = [total_requests // concurrency + (1 if i < total_requests % concurrency else 0)
+              for i in range(concurrency)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(worker, shares))
+    elapsed = time.perf_counter() - started
+
+    succeeded = [latency for _, latency, ok in results if ok]
+    if errors:
+        print(f"共 {len(errors)} 個查詢失敗，第一個錯誤：{errors[0]}")
+    report = {
+        "concurrency": concurrency,
+        "requests": len(results),
+        "errors": len(results) - len(succeeded),
+        "elapsed_s": elapsed,
+        "throughput_rps": len(results) / elapsed if elapsed else 0.0,
+        "overall": summarize(succeeded),
+        "by_kind": {},
+    }
+    for kind in ("character", "miss", "radical"):
+        latencies = [latency for k, latency, ok in results if ok and k == kind]
+        if latencies:
+            report["by_kind"][kind] = summarize(latencies)
+    return report
+
+
+def print_report(report: dict) -> None:
+    """輸出壓力測試結果"""
+    print(f"\n併發數: {report['concurrency']}  請求數: {report['requests']}  錯誤: {report['errors']}")
+    print(f"耗時: {report['elapsed_s']:.2f} 秒  吞吐量: {report['throughput_rps']:.1f} req/s")
+    print(f"{'種類':<10}{'筆數':>8}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}")
+    rows = [("overall", report["overall"])] + list(report["by_kind"].items())
+    for kind, stats in rows:
+        print(f"{kind:<10}{stats['count']:>8}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}"
+              f"{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}")
+
+
+def positive_int(value: str) -> int:
+    """argparse 用：只接受 >= 1 的整數"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"必須大於等於 1：{value}")
+    return number
+
+
+def main():
+    """主函數"""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    default_url = os.getenv("SUPABASE_URL")
+    parser = argparse.ArgumentParser(description="characters 資料表讀取路徑壓力測試")
+    parser.add_argument("--rest-url", default=f"{default_url}/rest/v1" if default_url else "http://localhost:54321/rest/v1",
+                        help="PostgREST 位址，例如本機 supabase start 的 http://localhost:54321/rest/v1")
+    parser.add_argument("--api-key", default=os.getenv("SUPABASE_KEY"))
+    parser.add_argument("--concurrency", type=positive_int, default=8)
+    parser.add_argument("--requests", type=positive_int, default=1000)
+    parser.add_argument("--radical-ratio", type=float, default=0.3, help="部首查詢所占比例")
+    parser.add_argument("--miss-ratio", type=float, default=0.1, help="字元搜尋中查無此字的比例")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--csv", type=Path, default=CSV_PATH)
+    parser.add_argument("--output", type=Path, help="將結果另存為 JSON，方便比較")
+    args = parser.parse_args()
+
+    mix = QueryMix(args.csv, args.radical_ratio, args.miss_ratio, args.seed)
+    print(f"正在對 {args.rest_url} 送出 {args.requests} 個查詢 (併發數 {args.concurrency})...")
+    report = run_load_test(args.rest_url, args.api_key, mix, args.concurrency, args.requests)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n結果已儲存至 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
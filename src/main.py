@@ -27,8 +27,8 @@ def main():
         classified_videos = {} # 使用字典來存放分類結果 { "分類名稱": [影片清單] }
 
         for video in videos:
-            video_id = video['id']
-            title = video['title']
+            video_id = video.id
+            title = video.title
             # category = classify_video_with_rules(title, category_rules) # 使用 yaml 規則
             category = classify_video_by_title(title) # 使用寫在程式碼中的規則
 
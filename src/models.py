@@ -0,0 +1,119 @@
+"""
+影片資料在整個處理流程中共用的精簡資料型別
+
+使用 __slots__ 的 dataclass 取代每部影片好幾份臨時字典，
+中文字以 sys.intern 共用同一個字串物件，部首以整數儲存。
+"""
+
+import sys
+import urllib.parse
+from dataclasses import dataclass
+from typing import List, Optional
+
+VIDEO_URL_PREFIX = "https://www.youtube.com/watch?v="
+
+
+@dataclass(slots=True)
+class Video:
+    """YouTube API 回傳的影片 (id, title)"""
+    id: str
+    title: str
+
+
+@dataclass(slots=True)
+class TitleInfo:
+    """從影片標題中解析出的篇號、序號與中文字"""
+    volume: str
+    sequence: str
+    character: str
+
+    def __post_init__(self):
+        self.character = sys.intern(self.character)
+
+
+@dataclass(slots=True)
+class CalligraphyVideo:
+    """
+    一部書法影片的完整資料，對應 CSV 的一列與 characters 資料表的一筆記錄
+
+    只保存影片 ID，網址在需要時才組出來；無法取出影片 ID 的網址則原樣保存。
+    """
+    volume: str
+    sequence: str
+    character: str
+    radical: Optional[int]
+    video_id: str
+
+    def __post_init__(self):
+        self.character = sys.intern(self.character)
+
+    @property
+    def url(self) -> str:
+        # 影片 ID 不含 "/"，含有 "/" 表示保存的是無法解析的原始網址
+        if "/" in self.video_id:
+            return self.video_id
+        return f"{VIDEO_URL_PREFIX}{self.video_id}"
+
+    @classmethod
+    def from_title_info(cls, info: TitleInfo, radical: Optional[int], video_id: str) -> "CalligraphyVideo":
+        return cls(info.volume, info.sequence, info.character, radical, video_id)
+
+    @classmethod
+    def from_csv_row(cls, volume, sequence, character, radical, url) -> "CalligraphyVideo":
+        """由 CSV 欄位 (篇, 序號, 中文字, 中文字部首, 影片網址) 建立記錄"""
+        return cls(str(volume), str(sequence), character, parse_radical(radical), parse_video_id(url))
+
+    def to_csv_row(self) -> List:
+        """轉換為 CSV 欄位 (篇, 序號, 中文字, 中文字部首, 影片網址)"""
+        return [
+            self.volume,
+            self.sequence,
+            self.character,
+            "" if self.radical is None else self.radical,
+            self.url
+        ]
+
+    def to_record(self) -> dict:
+        """轉換為 characters 資料表的欄位"""
+        return {
+            "chapter": int(self.volume),
+            "serial": int(self.sequence),
+            "character": self.character,
+            "radical": self.radical,
+            "video_url": self.url
+        }
+
+
+def parse_radical(value) -> Optional[int]:
+    """將部首編號 (字串、數字或空值) 轉換為整數，無效值返回 None"""
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        # 例如 pandas 的 NaN / NA 或 "85'" 這類簡化部首
+        return None
+
+
+def parse_video_id(url) -> str:
+    """
+    由影片網址取出影片 ID
+
+    支援 watch?v=、youtu.be/ 與 shorts/ 形式；無法取出時返回原本的網址，
+    讓 CalligraphyVideo.url 原樣輸出。
+    """
+    if not url:
+        return ""
+    if url.startswith(VIDEO_URL_PREFIX) and "&" not in url:
+        return url[len(VIDEO_URL_PREFIX):]
+    parsed = urllib.parse.urlparse(url)
+    host = parsed.netloc.lower()
+    if host == "youtu.be" or host.endswith(".youtu.be"):
+        video_id = parsed.path.strip("/")
+    elif host == "youtube.com" or host.endswith(".youtube.com"):
+        video_id = urllib.parse.parse_qs(parsed.query).get("v", [""])[0]
+        if not video_id and parsed.path.startswith("/shorts/"):
+            video_id = parsed.path[len("/shorts/"):].strip("/")
+    else:
+        video_id = ""
+    return video_id if video_id and "/" not in video_id else url
@@ -1,21 +1,4 @@
-import pandas as pd
-from cihai.core import Cihai
-from supabase import create_client
 import os
-from dotenv import load_dotenv
-
-# 載入環境變數
-load_dotenv()
-
-# 初始化 Cihai
-c = Cihai()
-if not c.unihan.is_bootstrapped:
-    c.unihan.bootstrap()
-
-# 初始化 Supabase 客戶端
-supabase_url = os.getenv("SUPABASE_URL")
-supabase_key = os.getenv("SUPABASE_KEY")
-supabase = create_client(supabase_url, supabase_key)
 
 # 定義部首映射表（包含筆劃數）
 radical_map = {
@@ -237,6 +220,15 @@ radical_map = {
 
 def process_radicals():
     """將部首映射表寫入資料庫"""
+    from dotenv import load_dotenv
+    from supabase import create_client
+
+    # 載入環境變數並初始化 Supabase 客戶端
+    load_dotenv()
+    supabase_url = os.getenv("SUPABASE_URL")
+    supabase_key = os.getenv("SUPABASE_KEY")
+    supabase = create_client(supabase_url, supabase_key)
+
     # 清空資料表
     print("正在清空 radical 資料表...")
     try:
@@ -0,0 +1,782 @@
+# -*- coding: utf-8 -*-
+"""
+部首查詢表 (由 src/generate_radicals.py 產生，請勿手動修改)
+
+所有查詢皆為 O(1)：以部首編號或筆劃數作為 tuple 索引，以字元查 dict。
+"""
+
+from typing import Optional, Tuple
+
+# 部首編號 → 部首字 (索引 0 不使用)
+RADICAL_CHARS = (
+    "",  # 0
+    "一",  # 1
+    "丨",  # 2
+    "丶",  # 3
+    "丿",  # 4
+    "乙",  # 5
+    "亅",  # 6
+    "二",  # 7
+    "亠",  # 8
+    "人",  # 9
+    "儿",  # 10
+    "入",  # 11
+    "八",  # 12
+    "冂",  # 13
+    "冖",  # 14
+    "冫",  # 15
+    "几",  # 16
+    "凵",  # 17
+    "刀",  # 18
+    "力",  # 19
+    "勹",  # 20
+    "匕",  # 21
+    "匚",  # 22
+    "匸",  # 23
+    "十",  # 24
+    "卜",  # 25
+    "卩",  # 26
+    "厂",  # 27
+    "厶",  # 28
+    "又",  # 29
+    "口",  # 30
+    "囗",  # 31
+    "土",  # 32
+    "士",  # 33
+    "夂",  # 34
+    "夊",  # 35
+    "夕",  # 36
+    "大",  # 37
+    "女",  # 38
+    "子",  # 39
+    "宀",  # 40
+    "寸",  # 41
+    "小",  # 42
+    "尢",  # 43
+    "尸",  # 44
+    "屮",  # 45
+    "山",  # 46
+    "巛",  # 47
+    "工",  # 48
+    "己",  # 49
+    "巾",  # 50
+    "干",  # 51
+    "幺",  # 52
+    "广",  # 53
+    "廴",  # 54
+    "廾",  # 55
+    "弋",  # 56
+    "弓",  # 57
+    "彐",  # 58
+    "彡",  # 59
+    "彳",  # 60
+    "心",  # 61
+    "戈",  # 62
+    "戶",  # 63
+    "手",  # 64
+    "支",  # 65
+    "攴",  # 66
+    "文",  # 67
+    "斗",  # 68
+    "斤",  # 69
+    "方",  # 70
+    "无",  # 71
+    "日",  # 72
+    "曰",  # 73
+    "月",  # 74
+    "木",  # 75
+    "欠",  # 76
+    "止",  # 77
+    "歹",  # 78
+    "殳",  # 79
+    "毋",  # 80
+    "比",  # 81
+    "毛",  # 82
+    "氏",  # 83
+    "气",  # 84
+    "水",  # 85
+    "火",  # 86
+    "爪",  # 87
+    "父",  # 88
+    "爻",  # 89
+    "爿",  # 90
+    "片",  # 91
+    "牙",  # 92
+    "牛",  # 93
+    "犬",  # 94
+    "玄",  # 95
+    "玉",  # 96
+    "瓜",  # 97
+    "瓦",  # 98
+    "甘",  # 99
+    "生",  # 100
+    "用",  # 101
+    "田",  # 102
+    "疋",  # 103
+    "疒",  # 104
+    "癶",  # 105
+    "白",  # 106
+    "皮",  # 107
+    "皿",  # 108
+    "目",  # 109
+    "矛",  # 110
+    "矢",  # 111
+    "石",  # 112
+    "示",  # 113
+    "禸",  # 114
+    "禾",  # 115
+    "穴",  # 116
+    "立",  # 117
+    "竹",  # 118
+    "米",  # 119
+    "糸",  # 120
+    "缶",  # 121
+    "网",  # 122
+    "羊",  # 123
+    "羽",  # 124
+    "老",  # 125
+    "而",  # 126
+    "耒",  # 127
+    "耳",  # 128
+    "聿",  # 129
+    "肉",  # 130
+    "臣",  # 131
+    "自",  # 132
+    "至",  # 133
+    "臼",  # 134
+    "舌",  # 135
+    "舛",  # 136
+    "舟",  # 137
+    "艮",  # 138
+    "色",  # 139
+    "艸",  # 140
+    "虍",  # 141
+    "虫",  # 142
+    "血",  # 143
+    "行",  # 144
+    "衣",  # 145
+    "襾",  # 146
+    "見",  # 147
+    "角",  # 148
+    "言",  # 149
+    "谷",  # 150
+    "豆",  # 151
+    "豕",  # 152
+    "豸",  # 153
+    "貝",  # 154
+    "赤",  # 155
+    "走",  # 156
+    "足",  # 157
+    "身",  # 158
+    "車",  # 159
+    "辛",  # 160
+    "辰",  # 161
+    "辵",  # 162
+    "邑",  # 163
+    "酉",  # 164
+    "釆",  # 165
+    "里",  # 166
+    "金",  # 167
+    "長",  # 168
+    "門",  # 169
+    "阜",  # 170
+    "隶",  # 171
+    "隹",  # 172
+    "雨",  # 173
+    "靑",  # 174
+    "非",  # 175
+    "面",  # 176
+    "革",  # 177
+    "韋",  # 178
+    "韭",  # 179
+    "音",  # 180
+    "頁",  # 181
+    "風",  # 182
+    "飛",  # 183
+    "食",  # 184
+    "首",  # 185
+    "香",  # 186
+    "馬",  # 187
+    "骨",  # 188
+    "高",  # 189
+    "髟",  # 190
+    "鬥",  # 191
+    "鬯",  # 192
+    "鬲",  # 193
+    "鬼",  # 194
+    "魚",  # 195
+    "鳥",  # 196
+    "鹵",  # 197
+    "鹿",  # 198
+    "麥",  # 199
+    "麻",  # 200
+    "黃",  # 201
+    "黍",  # 202
+    "黑",  # 203
+    "黹",  # 204
+    "黽",  # 205
+    "鼎",  # 206
+    "鼓",  # 207
+    "鼠",  # 208
+    "鼻",  # 209
+    "齊",  # 210
+    "齒",  # 211
+    "龍",  # 212
+    "龜",  # 213
+    "龠",  # 214
+)
+
+# 部首編號 → 筆劃數 (索引 0 不使用)
+RADICAL_STROKES = (
+    0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+    2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+    3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+    3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5,
+    5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+    7, 7, 7, 7, 7, 7, 7, 8, 8, 8, 8, 8, 8, 8, 8, 8, 9, 9, 9, 9,
+    9, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10, 10, 10, 10, 11, 11, 11, 11, 11,
+    11, 12, 12, 12, 12, 13, 13, 13, 13, 14, 14, 15, 16, 16, 17,
+)
+
+# 筆劃數 → 部首編號 (索引 0 不使用)
+RADICALS_BY_STROKES = (
+    (),  # 0
+    (1, 2, 3, 4, 5, 6),  # 1
+    (7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29),  # 2
+    (30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60),  # 3
+    (61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94),  # 4
+    (95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117),  # 5
+    (118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146),  # 6
+    (147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166),  # 7
+    (167, 168, 169, 170, 171, 172, 173, 174, 175),  # 8
+    (176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186),  # 9
+    (187, 188, 189, 190, 191, 192, 193, 194),  # 10
+    (195, 196, 197, 198, 199, 200),  # 11
+    (201, 202, 203, 204),  # 12
+    (205, 206, 207, 208),  # 13
+    (209, 210),  # 14
+    (211,),  # 15
+    (212, 213),  # 16
+    (214,),  # 17
+)
+
+# 部首字、變形 (例如 氵 扌 艹) 與康熙部首區塊字元 → 部首編號
+CHAR_TO_RADICAL = {
+    "一": 1,
+    "丨": 2,
+    "丶": 3,
+    "丿": 4,
+    "乙": 5,
+    "亅": 6,
+    "二": 7,
+    "亠": 8,
+    "人": 9,
+    "儿": 10,
+    "入": 11,
+    "八": 12,
+    "冂": 13,
+    "冖": 14,
+    "冫": 15,
+    "几": 16,
+    "凵": 17,
+    "刀": 18,
+    "力": 19,
+    "勹": 20,
+    "匕": 21,
+    "匚": 22,
+    "匸": 23,
+    "十": 24,
+    "卜": 25,
+    "卩": 26,
+    "厂": 27,
+    "厶": 28,
+    "又": 29,
+    "口": 30,
+    "囗": 31,
+    "土": 32,
+    "士": 33,
+    "夂": 34,
+    "夊": 35,
+    "夕": 36,
+    "大": 37,
+    "女": 38,
+    "子": 39,
+    "宀": 40,
+    "寸": 41,
+    "小": 42,
+    "尢": 43,
+    "尸": 44,
+    "屮": 45,
+    "山": 46,
+    "巛": 47,
+    "工": 48,
+    "己": 49,
+    "巾": 50,
+    "干": 51,
+    "幺": 52,
+    "广": 53,
+    "廴": 54,
+    "廾": 55,
+    "弋": 56,
+    "弓": 57,
+    "彐": 58,
+    "彡": 59,
+    "彳": 60,
+    "心": 61,
+    "戈": 62,
+    "戶": 63,
+    "手": 64,
+    "支": 65,
+    "攴": 66,
+    "文": 67,
+    "斗": 68,
+    "斤": 69,
+    "方": 70,
+    "无": 71,
+    "日": 72,
+    "曰": 73,
+    "月": 74,
+    "木": 75,
+    "欠": 76,
+    "止": 77,
+    "歹": 78,
+    "殳": 79,
+    "毋": 80,
+    "比": 81,
+    "毛": 82,
+    "氏": 83,
+    "气": 84,
+    "水": 85,
+    "火": 86,
+    "爪": 87,
+    "父": 88,
+    "爻": 89,
+    "爿": 90,
+    "片": 91,
+    "牙": 92,
+    "牛": 93,
+    "犬": 94,
+    "玄": 95,
+    "玉": 96,
+    "瓜": 97,
+    "瓦": 98,
+    "甘": 99,
+    "生": 100,
+    "用": 101,
+    "田": 102,
+    "疋": 103,
+    "疒": 104,
+    "癶": 105,
+    "白": 106,
+    "皮": 107,
+    "皿": 108,
+    "目": 109,
+    "矛": 110,
+    "矢": 111,
+    "石": 112,
+    "示": 113,
+    "禸": 114,
+    "禾": 115,
+    "穴": 116,
+    "立": 117,
+    "竹": 118,
+    "米": 119,
+    "糸": 120,
+    "缶": 121,
+    "网": 122,
+    "羊": 123,
+    "羽": 124,
+    "老": 125,
+    "而": 126,
+    "耒": 127,
+    "耳": 128,
+    "聿": 129,
+    "肉": 130,
+    "臣": 131,
+    "自": 132,
+    "至": 133,
+    "臼": 134,
+    "舌": 135,
+    "舛": 136,
+    "舟": 137,
+    "艮": 138,
+    "色": 139,
+    "艸": 140,
+    "虍": 141,
+    "虫": 142,
+    "血": 143,
+    "行": 144,
+    "衣": 145,
+    "襾": 146,
+    "見": 147,
+    "角": 148,
+    "言": 149,
+    "谷": 150,
+    "豆": 151,
+    "豕": 152,
+    "豸": 153,
+    "貝": 154,
+    "赤": 155,
+    "走": 156,
+    "足": 157,
+    "身": 158,
+    "車": 159,
+    "辛": 160,
+    "辰": 161,
+    "辵": 162,
+    "邑": 163,
+    "酉": 164,
+    "釆": 165,
+    "里": 166,
+    "金": 167,
+    "長": 168,
+    "門": 169,
+    "阜": 170,
+    "隶": 171,
+    "隹": 172,
+    "雨": 173,
+    "靑": 174,
+    "非": 175,
+    "面": 176,
+    "革": 177,
+    "韋": 178,
+    "韭": 179,
+    "音": 180,
+    "頁": 181,
+    "風": 182,
+    "飛": 183,
+    "食": 184,
+    "首": 185,
+    "香": 186,
+    "馬": 187,
+    "骨": 188,
+    "高": 189,
+    "髟": 190,
+    "鬥": 191,
+    "鬯": 192,
+    "鬲": 193,
+    "鬼": 194,
+    "魚": 195,
+    "鳥": 196,
+    "鹵": 197,
+    "鹿": 198,
+    "麥": 199,
+    "麻": 200,
+    "黃": 201,
+    "黍": 202,
+    "黑": 203,
+    "黹": 204,
+    "黽": 205,
+    "鼎": 206,
+    "鼓": 207,
+    "鼠": 208,
+    "鼻": 209,
+    "齊": 210,
+    "齒": 211,
+    "龍": 212,
+    "龜": 213,
+    "龠": 214,
+    "⼀": 1,
+    "⼁": 2,
+    "⼂": 3,
+    "⼃": 4,
+    "⼄": 5,
+    "⼅": 6,
+    "⼆": 7,
+    "⼇": 8,
+    "⼈": 9,
+    "⼉": 10,
+    "⼊": 11,
+    "⼋": 12,
+    "⼌": 13,
+    "⼍": 14,
+    "⼎": 15,
+    "⼏": 16,
+    "⼐": 17,
+    "⼑": 18,
+    "⼒": 19,
+    "⼓": 20,
+    "⼔": 21,
+    "⼕": 22,
+    "⼖": 23,
+    "⼗": 24,
+    "⼘": 25,
+    "⼙": 26,
+    "⼚": 27,
+    "⼛": 28,
+    "⼜": 29,
+    "⼝": 30,
+    "⼞": 31,
+    "⼟": 32,
+    "⼠": 33,
+    "⼡": 34,
+    "⼢": 35,
+    "⼣": 36,
+    "⼤": 37,
+    "⼥": 38,
+    "⼦": 39,
+    "⼧": 40,
+    "⼨": 41,
+    "⼩": 42,
+    "⼪": 43,
+    "⼫": 44,
+    "⼬": 45,
+    "⼭": 46,
+    "⼮": 47,
+    "⼯": 48,
+    "⼰": 49,
+    "⼱": 50,
+    "⼲": 51,
+    "⼳": 52,
+    "⼴": 53,
+    "⼵": 54,
+    "⼶": 55,
+    "⼷": 56,
+    "⼸": 57,
+    "⼹": 58,
+    "⼺": 59,
+    "⼻": 60,
+    "⼼": 61,
+    "⼽": 62,
+    "⼾": 63,
+    "⼿": 64,
+    "⽀": 65,
+    "⽁": 66,
+    "⽂": 67,
+    "⽃": 68,
+    "⽄": 69,
+    "⽅": 70,
+    "⽆": 71,
+    "⽇": 72,
+    "⽈": 73,
+    "⽉": 74,
+    "⽊": 75,
+    "⽋": 76,
+    "⽌": 77,
+    "⽍": 78,
+    "⽎": 79,
+    "⽏": 80,
+    "⽐": 81,
+    "⽑": 82,
+    "⽒": 83,
+    "⽓": 84,
+    "⽔": 85,
+    "⽕": 86,
+    "⽖": 87,
+    "⽗": 88,
+    "⽘": 89,
+    "⽙": 90,
+    "⽚": 91,
+    "⽛": 92,
+    "⽜": 93,
+    "⽝": 94,
+    "⽞": 95,
+    "⽟": 96,
+    "⽠": 97,
+    "⽡": 98,
+    "⽢": 99,
+    "⽣": 100,
+    "⽤": 101,
+    "⽥": 102,
+    "⽦": 103,
+    "⽧": 104,
+    "⽨": 105,
+    "⽩": 106,
+    "⽪": 107,
+    "⽫": 108,
+    "⽬": 109,
+    "⽭": 110,
+    "⽮": 111,
+    "⽯": 112,
+    "⽰": 113,
+    "⽱": 114,
+    "⽲": 115,
+    "⽳": 116,
+    "⽴": 117,
+    "⽵": 118,
+    "⽶": 119,
+    "⽷": 120,
+    "⽸": 121,
+    "⽹": 122,
+    "⽺": 123,
+    "⽻": 124,
+    "⽼": 125,
+    "⽽": 126,
+    "⽾": 127,
+    "⽿": 128,
+    "⾀": 129,
+    "⾁": 130,
+    "⾂": 131,
+    "⾃": 132,
+    "⾄": 133,
+    "⾅": 134,
+    "⾆": 135,
+    "⾇": 136,
+    "⾈": 137,
+    "⾉": 138,
+    "⾊": 139,
+    "⾋": 140,
+    "⾌": 141,
+    "⾍": 142,
+    "⾎": 143,
+    "⾏": 144,
+    "⾐": 145,
+    "⾑": 146,
+    "⾒": 147,
+    "⾓": 148,
+    "⾔": 149,
+    "⾕": 150,
+    "⾖": 151,
+    "⾗": 152,
+    "⾘": 153,
+    "⾙": 154,
+    "⾚": 155,
+    "⾛": 156,
+    "⾜": 157,
+    "⾝": 158,
+    "⾞": 159,
+    "⾟": 160,
+    "⾠": 161,
+    "⾡": 162,
+    "⾢": 163,
+    "⾣": 164,
+    "⾤": 165,
+    "⾥": 166,
+    "⾦": 167,
+    "⾧": 168,
+    "⾨": 169,
+    "⾩": 170,
+    "⾪": 171,
+    "⾫": 172,
+    "⾬": 173,
+    "⾭": 174,
+    "⾮": 175,
+    "⾯": 176,
+    "⾰": 177,
+    "⾱": 178,
+    "⾲": 179,
+    "⾳": 180,
+    "⾴": 181,
+    "⾵": 182,
+    "⾶": 183,
+    "⾷": 184,
+    "⾸": 185,
+    "⾹": 186,
+    "⾺": 187,
+    "⾻": 188,
+    "⾼": 189,
+    "⾽": 190,
+    "⾾": 191,
+    "⾿": 192,
+    "⿀": 193,
+    "⿁": 194,
+    "⿂": 195,
+    "⿃": 196,
+    "⿄": 197,
+    "⿅": 198,
+    "⿆": 199,
+    "⿇": 200,
+    "⿈": 201,
+    "⿉": 202,
+    "⿊": 203,
+    "⿋": 204,
+    "⿌": 205,
+    "⿍": 206,
+    "⿎": 207,
+    "⿏": 208,
+    "⿐": 209,
+    "⿑": 210,
+    "⿒": 211,
+    "⿓": 212,
+    "⿔": 213,
+    "⿕": 214,
+    "乚": 5,
+    "乛": 5,
+    "亻": 9,
+    "刂": 18,
+    "㔾": 26,
+    "尣": 43,
+    "彑": 58,
+    "忄": 61,
+    "㣺": 61,
+    "户": 63,
+    "戸": 63,
+    "扌": 64,
+    "攵": 66,
+    "旡": 71,
+    "歺": 78,
+    "氵": 85,
+    "氺": 85,
+    "灬": 86,
+    "爫": 87,
+    "丬": 90,
+    "牜": 93,
+    "犭": 94,
+    "王": 96,
+    "礻": 113,
+    "糹": 120,
+    "纟": 120,
+    "罒": 122,
+    "罓": 122,
+    "耂": 125,
+    "肀": 129,
+    "⺼": 130,
+    "艹": 140,
+    "衤": 145,
+    "西": 146,
+    "覀": 146,
+    "见": 147,
+    "讠": 149,
+    "贝": 154,
+    "车": 159,
+    "辶": 162,
+    "⻌": 162,
+    "⻍": 162,
+    "釒": 167,
+    "钅": 167,
+    "长": 168,
+    "镸": 168,
+    "门": 169,
+    "青": 174,
+    "页": 181,
+    "风": 182,
+    "飞": 183,
+    "飠": 184,
+    "饣": 184,
+    "马": 187,
+    "鱼": 195,
+    "鸟": 196,
+    "卤": 197,
+    "麦": 199,
+    "黄": 201,
+    "黾": 205,
+    "齐": 210,
+    "齿": 211,
+    "龙": 212,
+    "龟": 213,
+}
+
+
+def radical_number(char: str) -> Optional[int]:
+    """由部首字或其變形取得部首編號，不是部首則返回 None"""
+    return CHAR_TO_RADICAL.get(char)
+
+
+def radical_char(number: int) -> str:
+    """由部首編號取得部首字"""
+    return RADICAL_CHARS[number]
+
+
+def radical_strokes(number: int) -> int:
+    """由部首編號取得筆劃數"""
+    return RADICAL_STROKES[number]
+
+
+def radicals_by_strokes(strokes: int) -> Tuple[int, ...]:
+    """取得指定筆劃數的所有部首編號"""
+    if 0 < strokes < len(RADICALS_BY_STROKES):
+        return RADICALS_BY_STROKES[strokes]
+    return ()
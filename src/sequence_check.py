@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+檢查 calligraphy_videos.csv 的序號缺漏與重複，並只針對有問題的影片重新抓取
+
+每日一字依序號 (0001…1423) 編排。本程式找出缺少、重複或無法解析的序號，
+輸出報告 (含無法解析的標題，供人工檢查)；--repair 模式只抓取
+  - 上次擷取時無法解析、尚未重新抓取過的影片
+  - 序號重複的影片
+  - 有新的缺號時，頻道中尚未出現在 CSV 的影片 (只列 ID，每 50 部一次呼叫)
+重新解析後合併回 CSV，不需要重新抓取整個頻道。
+
+掃描過整個頻道後仍然缺少的序號記為 confirmed_missing (頻道中確實沒有這些影片)，
+已抓取過但無法解析的影片 ID 記為 checked_ids；之後的 --repair 不再為這些序號掃描頻道，
+也不再重新抓取這些影片，除非指定 --rescan。
+
+用法:
+    python -m src.sequence_check            # 只檢查並輸出報告
+    python -m src.sequence_check --repair   # 檢查後抓取有問題的影片並更新 CSV
+    python -m src.sequence_check --repair --rescan   # 忽略上次確認的結果，重新掃描頻道
+"""
+
+import argparse
+import csv
+import json
+import math
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+from src.models import CalligraphyVideo, Video, VIDEO_URL_PREFIX, parse_radical
+
+ROOT_DIR = Path(__file__).parent.parent
+CSV_PATH = ROOT_DIR / "calligraphy_videos.csv"
+REPORT_PATH = ROOT_DIR / "sequence_report.json"
+CSV_COLUMNS = ['篇', '序號', '中文字', '中文字部首', '影片網址']
+
+
+def load_videos_frame(csv_path: Path = CSV_PATH) -> pd.DataFrame:
+    """以字串讀取 CSV，保留序號的前導零"""
+    return pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+
+
+def video_ids(df: pd.DataFrame) -> pd.Series:
+    """由影片網址欄位取出影片 ID"""
+    return df['影片網址'].str.replace(VIDEO_URL_PREFIX, '', regex=False)
+
+
+def analyze_sequences(df: pd.DataFrame, first: int = 1, last: Optional[int] = None) -> Dict:
+    """
+    分析序號的缺漏與重複
+
+    Args:
+        df: load_videos_frame 讀入的資料
+        first: 預期的第一個序號
+        last: 預期的最後一個序號，預設為目前最大的序號
+
+    Returns:
+        包含 missing (缺少的序號)、duplicates (序號 → 影片 ID list)、
+        invalid (序號無法轉為數字的影片 ID) 的字典
+    """
+    sequences = pd.to_numeric(df['序號'], errors='coerce')
+    ids = video_ids(df)
+
+    valid = sequences.notna()
+    values = sequences[valid].astype(np.int64).to_numpy()
+    if last is None:
+        last = int(values.max()) if len(values) else first - 1
+
+    expected = np.arange(first, last + 1, dtype=np.int64)
+    missing = expected[~np.isin(expected, values)]
+
+    duplicated = sequences.duplicated(keep=False) & valid
+    duplicates = (
+        ids[duplicated].groupby(sequences[duplicated].astype(np.int64)).apply(list).to_dict()
+    )
+
+    return {
+        'total': int(len(df)),
+        'first': first,
+        'last': last,
+        'missing': [int(n) for n in missing],
+        'duplicates': {int(seq): dup_ids for seq, dup_ids in sorted(duplicates.items())},
+        'invalid': ids[~valid].tolist(),
+    }
+
+
+def load_report(report_path: Path = REPORT_PATH) -> Dict:
+    """讀取上次的報告，不存在則返回空字典"""
+    if not report_path.exists():
+        return {}
+    with open(report_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_report(analysis: Dict, unparsed: List[Video], report_path: Path = REPORT_PATH,
+                 confirmed_missing: Iterable[int] = (), checked_ids: Iterable[str] = ()) -> Dict:
+    """
+    將分析結果與無法解析的標題寫入報告，並返回報告內容
+
+    Args:
+        confirmed_missing: 已掃描過頻道、確認沒有影片的序號 (只保留仍然缺少的)
+        checked_ids: 已抓取過但標題無法解析的影片 ID
+    """
+    report = dict(analysis)
+    report['unparsed'] = [{'id': video.id, 'title': video.title} for video in unparsed]
+    report['confirmed_missing'] = sorted(set(confirmed_missing) & set(analysis['missing']))
+    report['checked_ids'] = sorted(set(checked_ids))
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return report
+
+
+def merge_repaired_rows(rows: List[List[str]], targets: Set[str],
+                        records: List[CalligraphyVideo]) -> List[List[str]]:
+    """
+    將重新解析的記錄合併回既有的 CSV 資料列，其餘資料列維持原本順序
+
+    Args:
+        rows: 既有資料列 (篇, 序號, 中文字, 中文字部首, 影片網址)，不含標題列
+        targets: 重新抓取的影片 ID
+        records: 重新解析成功的記錄
+
+    Returns:
+        合併後的資料列：已存在的影片就地取代，重新抓取但已刪除或無法解析的影片移除，
+        新的影片依序號插入 (CSV 依序號由大到小排列)
+    """
+    replacements = {record.video_id: [str(v) for v in record.to_csv_row()] for record in records}
+    merged = []
+    for row in rows:
+        video_id = row[4].replace(VIDEO_URL_PREFIX, '', 1)
+        if video_id in replacements:
+            merged.append(replacements.pop(video_id))
+        elif video_id not in targets:
+            merged.append(row)
+
+    def sequence_of(row) -> int:
+        return int(row[1]) if row[1].isdigit() else -1
+
+    for row in sorted(replacements.values(), key=sequence_of, reverse=True):
+        sequence = sequence_of(row)
+        position = next((i for i, existing in enumerate(merged) if sequence_of(existing) < sequence), len(merged))
+        merged.insert(position, row)
+    return merged
+
+
+def write_rows(rows: List[List[str]], csv_path: Path = CSV_PATH) -> None:
+    """以 csv.writer 寫出 CSV，與 extract_calligraphy_videos 的輸出格式相同"""
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        writer.writerows(rows)
+
+
+def print_summary(report: Dict) -> None:
+    """輸出報告摘要"""
+    print(f"共 {report['total']} 筆，序號範圍 {report['first']:04d}–{report['last']:04d}")
+    print(f"缺少序號 ({len(report['missing'])}): {', '.join(f'{n:04d}' for n in report['missing']) or '無'}")
+    confirmed = report.get('confirmed_missing', [])
+    if confirmed:
+        print(f"  其中已確認頻道中沒有的序號 ({len(confirmed)}): {', '.join(f'{n:04d}' for n in confirmed)}")
+    print(f"重複序號 ({len(report['duplicates'])}): "
+          f"{', '.join(f'{int(seq):04d}' for seq in report['duplicates']) or '無'}")
+    if report['invalid']:
+        print(f"序號無效的影片 ({len(report['invalid'])}): {', '.join(report['invalid'])}")
+    unparsed = report.get('unparsed', [])
+    print(f"無法解析的標題 ({len(unparsed)}):")
+    for video in unparsed:
+        print(f"  - {video['title']} ({VIDEO_URL_PREFIX}{video['id']})")
+
+
+def repair(api_key: str, channel_id: str, csv_path: Path = CSV_PATH,
+           report_path: Path = REPORT_PATH, last: Optional[int] = None, rescan: bool = False) -> Dict:
+    """
+    只重新抓取有問題的影片，合併回 CSV 並更新報告
+
+    Args:
+        rescan: 忽略上次報告的 confirmed_missing 與 checked_ids，重新掃描頻道並抓取
+
+    Returns:
+        更新後的報告
+    """
+    from src.extract_calligraphy_videos import extract_info_from_title, get_radical, init_cihai
+    from src.youtube_api import get_channel_video_ids, get_videos
+
+    df = load_videos_frame(csv_path)
+    analysis = analyze_sequences(df, last=last)
+    previous = load_report(report_path)
+    confirmed_missing = set() if rescan else set(previous.get('confirmed_missing', []))
+    checked_ids = set() if rescan else set(previous.get('checked_ids', []))
+    previous_unparsed = [Video(video['id'], video['title']) for video in previous.get('unparsed', [])]
+
+    targets = {video.id for video in previous_unparsed} - checked_ids
+    for dup_ids in analysis['duplicates'].values():
+        targets.update(dup_ids)
+    targets.update(analysis['invalid'])
+
+    api_calls = 0
+    scanned = False
+    if not set(analysis['missing']) <= confirmed_missing:
+        # 有尚未確認的缺號：只列出頻道影片 ID，找出 CSV 中還沒有的影片
+        channel_ids = get_channel_video_ids(api_key, channel_id, lean=True)
+        if channel_ids is not None:
+            scanned = True
+            api_calls += 1 + math.ceil(len(channel_ids) / 50)
+            known = set(video_ids(df)) | checked_ids
+            targets.update(video_id for video_id in channel_ids if video_id not in known)
+    elif analysis['missing']:
+        print(f"缺少的 {len(analysis['missing'])} 個序號已確認頻道中沒有，略過頻道掃描 (--rescan 可重新掃描)")
+
+    # 沒有重新抓取的影片保留在報告中
+    kept_unparsed = [video for video in previous_unparsed if video.id not in targets]
+
+    if not targets:
+        print("沒有需要重新抓取的影片。")
+        if scanned:
+            confirmed_missing = set(analysis['missing'])
+        return write_report(analysis, kept_unparsed, report_path, confirmed_missing, checked_ids)
+
+    print(f"重新抓取 {len(targets)} 部影片...")
+    videos = get_videos(api_key, sorted(targets), lean=True)
+    if videos is None:
+        raise RuntimeError("無法獲取影片資訊")
+    api_calls += math.ceil(len(targets) / 50)
+
+    c = None
+    records = []
+    unparsed = []
+    for video in videos:
+        info = extract_info_from_title(video.title)
+        if not info:
+            unparsed.append(video)
+            continue
+        if c is None:
+            c = init_cihai()
+        radical = parse_radical(get_radical(c, info.character))
+        records.append(CalligraphyVideo.from_title_info(info, radical, video.id))
+    checked_ids.update(video.id for video in unparsed)
+
+    # 只更動受影響的資料列，其餘資料列與順序維持不變
+    rows = merge_repaired_rows(df[CSV_COLUMNS].values.tolist(), targets, records)
+    write_rows(rows, csv_path)
+
+    removed = len(df) + len(records) - len(rows)
+    print(f"新增或更新 {len(records)} 筆，移除 {removed} 筆舊資料，"
+          f"約使用 {api_calls} 次 API 呼叫")
+
+    merged = analyze_sequences(pd.DataFrame(rows, columns=CSV_COLUMNS), last=last)
+    if scanned:
+        # 掃描過整個頻道後仍然缺少的序號，頻道中確實沒有對應的影片
+        confirmed_missing = set(merged['missing'])
+    return write_report(merged, kept_unparsed + unparsed, report_path, confirmed_missing, checked_ids)
+
+
+def main():
+    """主函數"""
+    parser = argparse.ArgumentParser(description="檢查序號缺漏與重複")
+    parser.add_argument("--repair", action="store_true", help="重新抓取有問題的影片並更新 CSV")
+    parser.add_argument("--rescan", action="store_true", help="搭配 --repair，忽略已確認的缺號並重新掃描頻道")
+    parser.add_argument("--last", type=int, default=None, help="預期的最後一個序號，預設為目前最大序號")
+    parser.add_argument("--csv", type=Path, default=CSV_PATH)
+    parser.add_argument("--report", type=Path, default=REPORT_PATH)
+    args = parser.parse_args()
+
+    try:
+        if args.repair:
+            from src.config_loader import load_config
+            config = load_config()
+            report = repair(config["api_key"], config["channel_id"], args.csv, args.report, args.last,
+                            args.rescan)
+        else:
+            # 保留上次擷取時記錄的無法解析標題與已確認的結果
+            previous = load_report(args.report)
+            unparsed = [Video(video['id'], video['title']) for video in previous.get('unparsed', [])]
+            report = write_report(analyze_sequences(load_videos_frame(args.csv), last=args.last), unparsed,
+                                  args.report, previous.get('confirmed_missing', []),
+                                  previous.get('checked_ids', []))
+
+        print_summary(report)
+        print(f"\n報告已儲存至 {args.report}")
+    except Exception as e:
+        print(f"處理過程中發生錯誤：{e}")
+
+
+if __name__ == "__main__":
+    main()
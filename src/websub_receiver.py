@@ -0,0 +1,329 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+以 WebSub (PubSubHubbub) 接收頻道新上傳影片的通知
+
+訂閱頻道的 Atom feed 後，hub 會在有新影片時 POST 通知到本服務，
+只針對通知中的影片解析標題、查詢部首並寫入 characters 資料表，
+不需要定期呼叫 YouTube API。
+
+hub 的訂閱有期限 (lease)，到期後就不再送出通知。serve 指定 --callback
+(或環境變數 WEBSUB_CALLBACK_URL) 時，會在啟動時訂閱，並在租期約 80% 時自動續訂；
+未指定時需以排程 (例如 cron 每週) 執行 subscribe 續訂。
+
+用法:
+    python -m src.websub_receiver serve --port 8080 --callback https://example.com/websub
+    python -m src.websub_receiver subscribe --callback https://example.com/websub
+    python -m src.websub_receiver replay --callback http://localhost:8080/ fixtures/websub/new_upload.xml
+"""
+
+import argparse
+import hmac
+import os
+import secrets
+import threading
+import urllib.parse
+import urllib.request
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional
+
+from src.models import Video, CalligraphyVideo, parse_radical
+
+SIGNATURE_METHODS = ("sha1", "sha256", "sha512")
+
+HUB_URL = "https://pubsubhubbub.appspot.com/subscribe"
+TOPIC_URL = "https://www.youtube.com/xml/feeds/videos.xml?channel_id={channel_id}"
+
+LEASE_SECONDS = 864000  # 10 天
+RENEW_RATIO = 0.8  # 租期過了 80% 時續訂
+RETRY_SECONDS = 300  # 續訂失敗時 5 分鐘後重試
+
+ATOM_NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "yt": "http://www.youtube.com/xml/schemas/2015",
+}
+
+
+def parse_notification(body: bytes) -> List[Video]:
+    """
+    解析 hub 送來的 Atom 通知
+
+    Args:
+        body: 通知內容 (Atom XML)
+
+    Returns:
+        通知中新增或更新的影片 list；刪除通知 (at:deleted-entry) 會被略過
+    """
+    root = ET.fromstring(body)
+    videos = []
+    for entry in root.findall("atom:entry", ATOM_NS):
+        video_id = entry.findtext("yt:videoId", default="", namespaces=ATOM_NS)
+        title = entry.findtext("atom:title", default="", namespaces=ATOM_NS)
+        if video_id and title:
+            videos.append(Video(video_id, title))
+    return videos
+
+
+def verify_signature(secret: str, body: bytes, header: Optional[str]) -> bool:
+    """檢查 X-Hub-Signature 標頭 (格式 "sha1=<hex>")"""
+    if not header or "=" not in header:
+        return False
+    method, signature = header.split("=", 1)
+    if method not in SIGNATURE_METHODS:
+        return False
+    expected = hmac.new(secret.encode("utf-8"), body, method).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+def sign(secret: str, body: bytes) -> str:
+    """產生 X-Hub-Signature 標頭值"""
+    return "sha1=" + hmac.new(secret.encode("utf-8"), body, "sha1").hexdigest()
+
+
+def make_processor(radical_lookup: Callable[[str], str],
+                   upsert: Callable[[dict], None]) -> Callable[[Video], Optional[CalligraphyVideo]]:
+    """
+    建立處理單一影片的函數：解析標題、查詢部首並寫入資料庫
+
+    Args:
+        radical_lookup: 由中文字取得部首編號的函數，例如 lambda ch: get_radical(c, ch)
+        upsert: 寫入一筆 characters 記錄的函數
+
+    Returns:
+        處理函數，標題不符合格式時返回 None
+    """
+    from src.extract_calligraphy_videos import extract_info_from_title
+
+    def process(video: Video) -> Optional[CalligraphyVideo]:
+        info = extract_info_from_title(video.title)
+        if not info:
+            print(f"略過不符合格式的標題: {video.title}")
+            return None
+        record = CalligraphyVideo.from_title_info(info, parse_radical(radical_lookup(info.character)), video.id)
+        upsert(record.to_record())
+        print(f"已更新: {record.character} (序號: {record.sequence}, 部首: {record.radical})")
+        return record
+
+    return process
+
+
+def make_handler(process: Callable[[Video], object], topic: Optional[str] = None,
+                 secret: Optional[str] = None):
+    """建立 HTTP handler 類別，處理 hub 的訂閱驗證 (GET) 與通知 (POST)"""
+
+    class WebSubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+            mode = query.get("hub.mode", [""])[0]
+            challenge = query.get("hub.challenge", [""])[0]
+            if mode not in ("subscribe", "unsubscribe") or not challenge:
+                self.send_error(400)
+                return
+            if topic and query.get("hub.topic", [""])[0] != topic:
+                self.send_error(404)
+                return
+            print(f"已確認 {mode}: {query.get('hub.topic', [''])[0]}")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.end_headers()
+            self.wfile.write(challenge.encode("utf-8"))
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length)
+
+            # 依規範，簽章不符時仍回覆 2xx，但忽略內容
+            if secret and not verify_signature(secret, body, self.headers.get("X-Hub-Signature")):
+                print("通知簽章不符，已忽略")
+                self.send_response(202)
+                self.end_headers()
+                return
+
+            try:
+                videos = parse_notification(body)
+            except ET.ParseError as e:
+                print(f"無法解析通知內容: {e}")
+                self.send_error(400)
+                return
+
+            failed = 0
+            for video in videos:
+                try:
+                    process(video)
+                except Exception as e:
+                    failed += 1
+                    print(f"處理影片 {video.id} 時發生錯誤: {e}")
+
+            # 回覆 5xx 讓 hub 重送；寫入使用 upsert，重送不會產生重複資料
+            if failed:
+                self.send_error(500, explain=f"{failed} 部影片處理失敗")
+                return
+
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    return WebSubHandler
+
+
+def subscribe(callback_url: str, channel_id: str, secret: Optional[str] = None,
+              mode: str = "subscribe", hub_url: str = HUB_URL, lease_seconds: int = LEASE_SECONDS) -> int:
+    """
+    向 hub 訂閱 (或取消訂閱) 頻道的上傳 feed
+
+    Returns:
+        hub 回應的 HTTP 狀態碼 (202 表示 hub 將非同步驗證 callback)
+    """
+    params = {
+        "hub.callback": callback_url,
+        "hub.topic": TOPIC_URL.format(channel_id=channel_id),
+        "hub.mode": mode,
+        "hub.verify": "async",
+        "hub.lease_seconds": str(lease_seconds),
+    }
+    if secret:
+        params["hub.secret"] = secret
+    data = urllib.parse.urlencode(params).encode("utf-8")
+    with urllib.request.urlopen(urllib.request.Request(hub_url, data=data)) as response:
+        return response.status
+
+
+def start_renewal(callback_url: str, channel_id: str, secret: Optional[str] = None,
+                  lease_seconds: int = LEASE_SECONDS,
+                  subscribe_func: Callable[..., int] = subscribe) -> threading.Event:
+    """
+    在背景執行緒中立即訂閱，之後在租期約 80% 時續訂
+
+    Returns:
+        設定 (set) 後即停止續訂的 Event
+    """
+    stop = threading.Event()
+
+    def run() -> None:
+        while not stop.is_set():
+            try:
+                status = subscribe_func(callback_url, channel_id, secret, lease_seconds=lease_seconds)
+                print(f"已向 hub 訂閱 (HTTP {status})，{int(lease_seconds * RENEW_RATIO)} 秒後續訂")
+                wait = lease_seconds * RENEW_RATIO
+            except Exception as e:
+                print(f"訂閱失敗，{RETRY_SECONDS} 秒後重試: {e}")
+                wait = min(RETRY_SECONDS, lease_seconds * RENEW_RATIO)
+            stop.wait(wait)
+
+    threading.Thread(target=run, daemon=True).start()
+    return stop
+
+
+def replay(callback_url: str, paths: List[str], topic: str, secret: Optional[str] = None) -> None:
+    """
+    模擬 hub：先驗證 callback，再依序重送錄下來的通知檔
+
+    用於在本機測試接收服務，不需要真的訂閱 YouTube。
+    """
+    challenge = secrets.token_hex(8)
+    query = urllib.parse.urlencode({"hub.mode": "subscribe", "hub.topic": topic,
+                                    "hub.challenge": challenge, "hub.lease_seconds": str(LEASE_SECONDS)})
+    separator = "&" if "?" in callback_url else "?"
+    with urllib.request.urlopen(f"{callback_url}{separator}{query}") as response:
+        if response.read().decode("utf-8") != challenge:
+            raise RuntimeError("callback 沒有正確回傳 hub.challenge")
+    print("callback 驗證成功")
+
+    for path in paths:
+        with open(path, "rb") as f:
+            body = f.read()
+        headers = {"Content-Type": "application/atom+xml"}
+        if secret:
+            headers["X-Hub-Signature"] = sign(secret, body)
+        request = urllib.request.Request(callback_url, data=body, headers=headers)
+        with urllib.request.urlopen(request) as response:
+            print(f"已重送 {path}: HTTP {response.status}")
+
+
+def serve(port: int, channel_id: Optional[str], secret: Optional[str],
+          callback_url: Optional[str] = None) -> None:
+    """啟動接收服務，寫入 Supabase 的 characters 資料表；指定 callback_url 時自動訂閱與續訂"""
+    from dotenv import load_dotenv
+    from supabase import create_client
+    from src.extract_calligraphy_videos import init_cihai, get_radical
+
+    load_dotenv()
+    supabase = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_KEY"))
+
+    print("初始化 Cihai 以獲取漢字部首...")
+    c = init_cihai()
+
+    def upsert(record: dict) -> None:
+        supabase.table("characters").upsert(record, on_conflict="video_url").execute()
+
+    # Cihai 共用一個 SQLAlchemy Session，不能在多個 handler 執行緒中同時使用；
+    # get_radical 發生錯誤時返回空字串，競爭條件會變成沒有部首的資料而不是 5xx
+    cihai_lock = threading.Lock()
+
+    def radical_lookup(character: str) -> str:
+        with cihai_lock:
+            return get_radical(c, character)
+
+    process = make_processor(radical_lookup, upsert)
+    topic = TOPIC_URL.format(channel_id=channel_id) if channel_id else None
+    server = ThreadingHTTPServer(("", port), make_handler(process, topic, secret))
+    print(f"WebSub 接收服務已啟動於 port {port}")
+
+    renewal = None
+    if callback_url and channel_id:
+        renewal = start_renewal(callback_url, channel_id, secret)
+    else:
+        print("未指定 --callback，不會自動續訂；請以排程執行 subscribe")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if renewal is not None:
+            renewal.set()
+        server.server_close()
+
+
+def main():
+    """主函數"""
+    parser = argparse.ArgumentParser(description="WebSub 新影片通知接收服務")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="啟動接收服務")
+    serve_parser.add_argument("--port", type=int, default=8080)
+    serve_parser.add_argument("--callback", default=None,
+                              help="對外可連線的 callback 網址，指定時自動訂閱並續訂")
+
+    for name in ("subscribe", "unsubscribe"):
+        sub_parser = subparsers.add_parser(name, help=f"向 hub {name}")
+        sub_parser.add_argument("--callback", required=True, help="對外可連線的 callback 網址")
+
+    replay_parser = subparsers.add_parser("replay", help="模擬 hub 重送錄下來的通知")
+    replay_parser.add_argument("--callback", default="http://localhost:8080/")
+    replay_parser.add_argument("files", nargs="+")
+
+    args = parser.parse_args()
+
+    # load_channel_id 會先把 .env 載入環境變數，接收服務不需要 YOUTUBE_API_KEY
+    from src.config_loader import load_channel_id
+    try:
+        channel_id = load_channel_id()
+    except ValueError:
+        if args.command != "replay":
+            raise
+        channel_id = os.getenv("TARGET_CHANNEL_ID", "CHANNEL_ID")
+    secret = os.getenv("WEBSUB_SECRET")
+
+    if args.command == "replay":
+        replay(args.callback, args.files, TOPIC_URL.format(channel_id=channel_id), secret)
+    elif args.command == "serve":
+        serve(args.port, channel_id, secret, args.callback or os.getenv("WEBSUB_CALLBACK_URL"))
+    else:
+        status = subscribe(args.callback, channel_id, secret, mode=args.command)
+        print(f"hub 回應: HTTP {status}")
+
+if __name__ == "__main__":
+    main()
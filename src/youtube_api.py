@@ -1,64 +1,194 @@
+import gzip
+import urllib.error
+import urllib.request
+import zlib
+from dataclasses import dataclass
+from typing import List, Optional
+from urllib.parse import urlparse
+
+import httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import DEFAULT_HTTP_TIMEOUT_SEC
+
+from src.models import Video
+
+# 精簡模式下各 API 只回傳實際用到的欄位 (partial response)
+LEAN_FIELDS = {
+    'channels': 'items/contentDetails/relatedPlaylists/uploads',
+    'playlistItems': 'nextPageToken,items/contentDetails/videoId',
+    'videos': 'items(id,snippet/title)',
+}
+
+@dataclass(slots=True)
+class CallStats:
+    """一次 API 呼叫傳輸的資料量"""
+    endpoint: str
+    wire_bytes: int
+    decoded_bytes: int
+    encoding: str
+
+class MeteredHttp:
+    """
+    給 googleapiclient 使用的 http 物件：強制 gzip 傳輸，並記錄每次呼叫傳輸與解壓後的位元組數
+
+    httplib2 會在回傳前自動解壓而無法得知實際傳輸量，因此改以 urllib 送出請求、
+    自行解壓，只依賴 googleapiclient 要求的 request() 介面與 httplib2.Response。
+    """
+
+    def __init__(self, timeout: float = DEFAULT_HTTP_TIMEOUT_SEC):
+        self.timeout = timeout
+        self.calls: List[CallStats] = []
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=None, connection_type=None):
+        headers = dict(headers or {})
+        headers['accept-encoding'] = 'gzip'
+        # Google API 需要 User-Agent 含有 "gzip" 才會壓縮回應
+        user_agent = headers.get('user-agent', '')
+        if 'gzip' not in user_agent:
+            headers['user-agent'] = f"{user_agent} (gzip)".strip()
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        request = urllib.request.Request(uri, data=body, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as raw:
+                status, header_items, wire = raw.status, raw.headers.items(), raw.read()
+        except urllib.error.HTTPError as e:
+            # 4xx / 5xx 交由 googleapiclient 轉為 HttpError
+            status, header_items, wire = e.code, e.headers.items(), e.read()
+
+        info = {key.lower(): value for key, value in header_items}
+        info['status'] = str(status)
+        encoding = info.pop('content-encoding', 'identity')
+        if encoding == 'gzip':
+            content = gzip.decompress(wire)
+        elif encoding == 'deflate':
+            content = zlib.decompress(wire)
+        else:
+            content = wire
+        if content is not wire:
+            info['-content-encoding'] = encoding
+            info['content-length'] = str(len(content))
+
+        self.calls.append(CallStats(
+            endpoint=urlparse(uri).path.rsplit('/', 1)[-1],
+            wire_bytes=len(wire),
+            decoded_bytes=len(content),
+            encoding=encoding
+        ))
+        return httplib2.Response(info), content
+
+    def close(self) -> None:
+        pass
+
+    def print_summary(self) -> None:
+        """輸出各 API 的呼叫次數與傳輸量"""
+        totals = {}
+        for call in self.calls:
+            count, wire, decoded = totals.get(call.endpoint, (0, 0, 0))
+            totals[call.endpoint] = (count + 1, wire + call.wire_bytes, decoded + call.decoded_bytes)
+        for endpoint, (count, wire, decoded) in totals.items():
+            print(f"  {endpoint}: {count} 次呼叫，傳輸 {wire:,} bytes (解壓後 {decoded:,} bytes)")
+
+def _build_client(api_key: str, lean: bool = False):
+    """
+    建立 YouTube API 客戶端
+
+    Returns:
+        (客戶端, MeteredHttp)；非精簡模式時 MeteredHttp 為 None
+    """
+    if not lean:
+        return build('youtube', 'v3', developerKey=api_key), None
+    http = MeteredHttp()
+    youtube = build('youtube', 'v3', developerKey=api_key, http=http)
+    http.calls.clear()  # 不計入載入 discovery 文件的請求
+    return youtube, http
+
+def _fields(endpoint: str, lean: bool) -> dict:
+    """精簡模式下加上 fields 參數"""
+    return {'fields': LEAN_FIELDS[endpoint]} if lean else {}
+
+def _print_transfer(http: Optional[MeteredHttp]) -> None:
+    if http is not None:
+        print("API 傳輸量：")
+        http.print_summary()
+
+def _list_upload_video_ids(youtube, channel_id: str, lean: bool = False) -> Optional[List[str]]:
+    """分頁獲取頻道 uploads playlist 中的所有影片 ID，找不到頻道時返回 None"""
+    # 1. 獲取頻道的 uploads playlist ID
+    channel_response = youtube.channels().list(
+        part='contentDetails',
+        id=channel_id,
+        **_fields('channels', lean)
+    ).execute()
+
+    if not channel_response.get('items'):
+        print(f"錯誤：找不到頻道 ID {channel_id}")
+        return None
+
+    uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+
+    # 2. 分頁獲取播放列表中的所有影片 ID
+    video_ids = []
+    next_page_token = None
+    while True:
+        playlist_response = youtube.playlistItems().list(
+            part='contentDetails',
+            playlistId=uploads_playlist_id,
+            maxResults=50, # API 每次最多返回 50 個
+            pageToken=next_page_token,
+            **_fields('playlistItems', lean)
+        ).execute()
+
+        video_ids.extend([item['contentDetails']['videoId'] for item in playlist_response.get('items', [])])
+
+        next_page_token = playlist_response.get('nextPageToken')
+        if not next_page_token:
+            break
+
+    return video_ids
 
-def get_channel_videos(api_key: str, channel_id: str):
+def _list_videos(youtube, video_ids: List[str], lean: bool = False) -> List[Video]:
+    """分批獲取影片的標題 (一次最多請求 50 個影片的詳細資訊)"""
+    all_videos_details = []
+    for i in range(0, len(video_ids), 50):
+        batch_ids = video_ids[i:i+50]
+        videos_response = youtube.videos().list(
+            part='snippet', # 我們只需要 snippet 中的 title
+            id=','.join(batch_ids),
+            **_fields('videos', lean)
+        ).execute()
+        all_videos_details.extend([
+            Video(item['id'], item['snippet']['title'])
+            for item in videos_response.get('items', [])
+        ])
+    return all_videos_details
+
+def get_channel_videos(api_key: str, channel_id: str, lean: bool = False):
     """
     獲取指定 YouTube 頻道的所有影片標題和 ID。
 
     Args:
         api_key: YouTube Data API v3 金鑰。
         channel_id: 目標 YouTube 頻道的 ID。
+        lean: 精簡模式，只請求標題等必要欄位、強制 gzip 並輸出每個 API 的傳輸量。
 
     Returns:
-        一個包含影片資訊 (id, title) 的 list。
+        一個包含影片資訊 Video(id, title) 的 list。
         如果發生錯誤則返回 None。
     """
     try:
-        youtube = build('youtube', 'v3', developerKey=api_key)
-
-        # 1. 獲取頻道的 uploads playlist ID
-        channel_response = youtube.channels().list(
-            part='contentDetails',
-            id=channel_id
-        ).execute()
+        youtube, http = _build_client(api_key, lean)
 
-        if not channel_response.get('items'):
-            print(f"錯誤：找不到頻道 ID {channel_id}")
+        video_ids = _list_upload_video_ids(youtube, channel_id, lean)
+        if video_ids is None:
             return None
 
-        uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
-
-        # 2. 分頁獲取播放列表中的所有影片 ID
-        video_ids = []
-        next_page_token = None
-        while True:
-            playlist_response = youtube.playlistItems().list(
-                part='contentDetails',
-                playlistId=uploads_playlist_id,
-                maxResults=50, # API 每次最多返回 50 個
-                pageToken=next_page_token
-            ).execute()
-
-            video_ids.extend([item['contentDetails']['videoId'] for item in playlist_response.get('items', [])])
-
-            next_page_token = playlist_response.get('nextPageToken')
-            if not next_page_token:
-                break
-
-        # 3. 分批獲取影片的標題 (一次最多請求 50 個影片的詳細資訊)
-        all_videos_details = []
-        for i in range(0, len(video_ids), 50):
-            batch_ids = video_ids[i:i+50]
-            videos_response = youtube.videos().list(
-                part='snippet', # 我們只需要 snippet 中的 title
-                id=','.join(batch_ids)
-            ).execute()
-            all_videos_details.extend([
-                {'id': item['id'], 'title': item['snippet']['title']}
-                for item in videos_response.get('items', [])
-            ])
+        all_videos_details = _list_videos(youtube, video_ids, lean)
 
         print(f"成功獲取頻道 {channel_id} 的 {len(all_videos_details)} 部影片資訊。")
+        _print_transfer(http)
         return all_videos_details
 
     except HttpError as e:
@@ -66,4 +196,45 @@ def get_channel_videos(api_key: str, channel_id: str):
         return None
     except Exception as e:
         print(f"處理過程中發生預期外的錯誤：{e}")
-        return None
\ No newline at end of file
+        return None
+
+def get_channel_video_ids(api_key: str, channel_id: str, lean: bool = False):
+    """
+    只獲取指定 YouTube 頻道的所有影片 ID，不取標題。
+
+    每 50 部影片只需一次 playlistItems 呼叫，可用來找出尚未處理的影片。
+
+    Returns:
+        影片 ID 的 list，如果發生錯誤則返回 None。
+    """
+    try:
+        youtube, http = _build_client(api_key, lean)
+        video_ids = _list_upload_video_ids(youtube, channel_id, lean)
+        _print_transfer(http)
+        return video_ids
+    except HttpError as e:
+        print(f"呼叫 YouTube API 時發生錯誤：{e}")
+        return None
+    except Exception as e:
+        print(f"處理過程中發生預期外的錯誤：{e}")
+        return None
+
+def get_videos(api_key: str, video_ids: List[str], lean: bool = False):
+    """
+    獲取指定影片 ID 的標題。
+
+    Returns:
+        一個包含影片資訊 Video(id, title) 的 list，已刪除或私人影片不會出現。
+        如果發生錯誤則返回 None。
+    """
+    try:
+        youtube, http = _build_client(api_key, lean)
+        videos = _list_videos(youtube, video_ids, lean)
+        _print_transfer(http)
+        return videos
+    except HttpError as e:
+        print(f"呼叫 YouTube API 時發生錯誤：{e}")
+        return None
+    except Exception as e:
+        print(f"處理過程中發生預期外的錯誤：{e}")
+        return None
@@ -0,0 +1,2 @@
+-- WebSub 接收服務以 video_url 進行 upsert，需要唯一索引
+create unique index if not exists characters_video_url_key on public.characters (video_url);
@@ -0,0 +1,84 @@
+import argparse
+import re
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.load_test import CSV_PATH, QueryMix, percentile, positive_int, run_load_test
+
+
+def test_percentile_nearest_rank():
+    values = [float(n) for n in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile(values, 7) == 7  # 0.07 * 100 不是剛好 7.0
+
+    ten = [float(n) for n in range(1, 11)]
+    assert percentile(ten, 50) == 5
+    assert percentile(ten, 95) == 10
+    assert percentile([7.0], 99) == 7
+    assert percentile([], 50) == 0.0
+
+
+def test_concurrency_must_be_positive():
+    assert positive_int("4") == 4
+    with pytest.raises(argparse.ArgumentTypeError):
+        positive_int("0")
+
+
+@pytest.fixture
+def postgrest():
+    """模擬 PostgREST 的 characters 端點，每 10 個請求回覆一次 500"""
+    queries = []
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urllib.parse.urlparse(self.path)
+            with lock:
+                queries.append((url.path, urllib.parse.unquote(url.query)))
+                fail = len(queries) % 10 == 0
+            if fail:
+                self.send_error(500)
+                return
+            body = b"[]"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/rest/v1", queries
+    server.shutdown()
+    server.server_close()
+
+
+def test_run_load_test_replays_query_mix(postgrest):
+    rest_url, queries = postgrest
+    mix = QueryMix(CSV_PATH, radical_ratio=0.3, miss_ratio=0.2, seed=1)
+    report = run_load_test(rest_url, "anon", mix, concurrency=4, total_requests=400)
+
+    assert len(queries) == 400
+    assert all(path == "/rest/v1/characters" for path, _ in queries)
+    radical = [q for _, q in queries if re.fullmatch(r"select=\*&radical=eq\.\d+&limit=10", q)]
+    character = [q for _, q in queries if re.fullmatch(r"select=\*&character=ilike\.\*.\*&limit=10", q)]
+    assert len(radical) + len(character) == 400
+    assert 0.2 < len(radical) / 400 < 0.4
+    misses = [q for q in character if q.split("*")[2] in mix.misses]
+    assert 0.1 < len(misses) / len(character) < 0.3
+
+    assert report["requests"] == 400
+    assert report["errors"] == 40
+    assert report["overall"]["count"] == 360
+    assert report["throughput_rps"] > 0
+    assert set(report["by_kind"]) == {"character", "miss", "radical"}
+    assert sum(stats["count"] for stats in report["by_kind"].values()) == 360
@@ -0,0 +1,50 @@
+import math
+
+import pytest
+
+from src.models import CalligraphyVideo, TitleInfo, parse_radical, parse_video_id
+
+
+def test_parse_radical():
+    assert parse_radical("85") == 85
+    assert parse_radical(64) == 64
+    assert parse_radical("") is None
+    assert parse_radical(None) is None
+    assert parse_radical(math.nan) is None
+    assert parse_radical("85'") is None
+
+
+def test_csv_row_round_trip():
+    row = ["9", "1423", "閶", "169", "https://www.youtube.com/watch?v=abTnZWgcg0g"]
+    record = CalligraphyVideo.from_csv_row(*row)
+    assert record.video_id == "abTnZWgcg0g"
+    assert record.radical == 169
+    assert record.to_csv_row() == ["9", "1423", "閶", 169, row[4]]
+
+    empty = CalligraphyVideo.from_csv_row("0", "0003", "三", "", row[4])
+    assert empty.radical is None
+    assert empty.to_csv_row()[3] == ""
+
+
+def test_non_canonical_urls_are_not_prefixed_twice():
+    for url in ("https://youtu.be/abTnZWgcg0g", "https://m.youtube.com/watch?v=abTnZWgcg0g&t=3",
+                "https://www.youtube.com/shorts/abTnZWgcg0g"):
+        assert parse_video_id(url) == "abTnZWgcg0g"
+    other = "https://example.com/video/1"
+    record = CalligraphyVideo.from_csv_row("0", "0001", "一", "1", other)
+    assert record.url == other
+    assert record.to_csv_row()[4] == other
+
+
+def test_to_record():
+    info = TitleInfo("09", "1423", "閶")
+    record = CalligraphyVideo.from_title_info(info, 169, "abTnZWgcg0g")
+    assert record.to_record() == {
+        "chapter": 9,
+        "serial": 1423,
+        "character": "閶",
+        "radical": 169,
+        "video_url": "https://www.youtube.com/watch?v=abTnZWgcg0g",
+    }
+    with pytest.raises(ValueError):
+        CalligraphyVideo.from_csv_row("", "0001", "一", "1", "").to_record()
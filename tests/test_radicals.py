@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+from src.extract_calligraphy_videos import get_radical
+from src.generate_radicals import PYTHON_OUTPUT, TYPESCRIPT_OUTPUT, build_tables, render_python, render_typescript
+from src.radicals import (RADICALS_BY_STROKES, radical_char, radical_number, radical_strokes,
+                          radicals_by_strokes)
+
+
+def test_generated_files_match_radical_map():
+    tables = build_tables()
+    assert PYTHON_OUTPUT.read_text(encoding="utf-8") == render_python(tables)
+    assert TYPESCRIPT_OUTPUT.read_text(encoding="utf-8") == render_typescript(tables)
+
+
+def test_variant_forms_resolve_to_kangxi_numbers():
+    assert radical_number("氵") == 85
+    assert radical_number("水") == 85
+    assert radical_number("扌") == 64
+    assert radical_number("艹") == 140
+    assert radical_number("⼀") == 1
+    assert radical_number("閶") is None
+    assert radical_char(85) == "水"
+    assert radical_strokes(85) == 4
+
+
+def test_radicals_by_strokes_bounds():
+    assert 1 in radicals_by_strokes(1)
+    assert radicals_by_strokes(17) == RADICALS_BY_STROKES[17]
+    assert radicals_by_strokes(0) == ()
+    assert radicals_by_strokes(len(RADICALS_BY_STROKES)) == ()
+    assert radicals_by_strokes(-1) == ()
+
+
+class FakeCihai:
+    def __init__(self, rows):
+        self.lookups = []
+        self.unihan = SimpleNamespace(lookup_char=self.lookup_char)
+        self.rows = rows
+
+    def lookup_char(self, character):
+        self.lookups.append(character)
+        return self.rows
+
+
+def test_get_radical_uses_table_before_unihan():
+    c = FakeCihai([{"kRSUnicode": "1.0"}])
+    assert get_radical(c, "氵") == "85"
+    assert c.lookups == []
+
+
+def test_get_radical_strips_simplified_marker():
+    c = FakeCihai([{"kRSKangXi": "147.5", "kRSUnicode": "147'.5"}])
+    assert get_radical(c, "觇") == "147"
+    assert c.lookups == ["觇"]
@@ -0,0 +1,93 @@
+import shutil
+from pathlib import Path
+
+import src.extract_calligraphy_videos as extractor
+import src.youtube_api as youtube_api
+from src.models import Video
+from src.sequence_check import analyze_sequences, load_videos_frame, repair, write_report
+
+CSV_PATH = Path(__file__).parent.parent / "calligraphy_videos.csv"
+
+
+def test_analyze_finds_gaps_and_duplicates(tmp_path):
+    csv_path = tmp_path / "videos.csv"
+    shutil.copy(CSV_PATH, csv_path)
+    with open(csv_path, "a", encoding="utf-8", newline="") as f:
+        f.write("0,0004,之,4,https://www.youtube.com/watch?v=dup\r\n")
+
+    analysis = analyze_sequences(load_videos_frame(csv_path))
+    assert analysis["missing"] == [3, 1398]
+    assert analysis["duplicates"] == {4: ["zcNEBkd_IMc", "dup"]}
+
+
+def test_repair_only_changes_affected_lines(tmp_path, monkeypatch):
+    csv_path = tmp_path / "videos.csv"
+    report_path = tmp_path / "report.json"
+    shutil.copy(CSV_PATH, csv_path)
+    original = csv_path.read_bytes().split(b"\r\n")
+
+    write_report(analyze_sequences(load_videos_frame(csv_path)), [Video("bad", "壞標題")], report_path)
+    channel = ["abTnZWgcg0g", "new3", "new1398", "bad"]
+    titles = {
+        "new3": "趙孟頫 每日一字 0003三",
+        "new1398": "趙孟頫 每日一字 1398霸~全集09篇",
+        "bad": "壞標題",
+    }
+    monkeypatch.setattr(youtube_api, "get_channel_video_ids", lambda *args, **kwargs: channel)
+    monkeypatch.setattr(youtube_api, "get_videos",
+                        lambda api_key, ids, **kwargs: [Video(i, titles[i]) for i in ids if i in titles])
+    monkeypatch.setattr(extractor, "init_cihai", lambda: None)
+    monkeypatch.setattr(extractor, "get_radical", lambda c, character: "")
+
+    report = repair("key", "channel", csv_path, report_path)
+
+    lines = csv_path.read_bytes().split(b"\r\n")
+    assert report["missing"] == []
+    assert [u["id"] for u in report["unparsed"]] == ["bad"]
+    assert len(lines) == len(original) + 2
+    added = [line for line in lines if line not in original]
+    assert added == [
+        "9,1398,霸,,https://www.youtube.com/watch?v=new1398".encode(),
+        "0,0003,三,,https://www.youtube.com/watch?v=new3".encode(),
+    ]
+    # 其餘資料列順序不變
+    assert [line for line in lines if line in original] == original
+    # 新的資料列依序號插入
+    assert lines[lines.index(added[0]) - 1].startswith("8,1399,".encode())
+    assert lines[lines.index(added[1]) - 1].startswith("0,0004,".encode())
+
+
+def test_repair_skips_confirmed_gaps_and_checked_videos(tmp_path, monkeypatch):
+    csv_path = tmp_path / "videos.csv"
+    report_path = tmp_path / "report.json"
+    shutil.copy(CSV_PATH, csv_path)
+    write_report(analyze_sequences(load_videos_frame(csv_path)), [Video("bad", "壞標題")], report_path)
+
+    scans = []
+    fetches = []
+
+    def get_channel_video_ids(*args, **kwargs):
+        scans.append(args)
+        return ["abTnZWgcg0g", "bad", "other"]
+
+    def get_videos(api_key, ids, **kwargs):
+        fetches.append(list(ids))
+        return [Video(i, "壞標題") for i in ids]
+
+    monkeypatch.setattr(youtube_api, "get_channel_video_ids", get_channel_video_ids)
+    monkeypatch.setattr(youtube_api, "get_videos", get_videos)
+
+    report = repair("key", "channel", csv_path, report_path)
+    assert len(scans) == 1 and fetches == [["bad", "other"]]
+    assert report["confirmed_missing"] == [3, 1398]
+    assert report["checked_ids"] == ["bad", "other"]
+    assert [u["id"] for u in report["unparsed"]] == ["bad", "other"]
+
+    # 缺號已確認、影片已抓取過：不再呼叫 API
+    report = repair("key", "channel", csv_path, report_path)
+    assert len(scans) == 1 and len(fetches) == 1
+    assert report["confirmed_missing"] == [3, 1398]
+    assert [u["id"] for u in report["unparsed"]] == ["bad", "other"]
+
+    repair("key", "channel", csv_path, report_path, rescan=True)
+    assert len(scans) == 2 and fetches[-1] == ["bad", "other"]
@@ -0,0 +1,72 @@
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from src.websub_receiver import make_handler, replay, sign, start_renewal, verify_signature, TOPIC_URL
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "websub"
+TOPIC = TOPIC_URL.format(channel_id="CHANNEL_ID")
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(process, secret=None):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(process, TOPIC, secret))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}/"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_replay_delivers_announced_video(serve):
+    received = []
+    url = serve(received.append, secret="s3cret")
+    replay(url, [str(FIXTURES / "new_upload.xml"), str(FIXTURES / "deleted.xml")], TOPIC, "s3cret")
+    assert [(video.id, video.title) for video in received] == [("abTnZWgcg0g", "趙孟頫 每日一字 1423閶~全集09篇")]
+
+
+def test_failed_processing_returns_5xx(serve):
+    def process(video):
+        raise RuntimeError("supabase down")
+
+    url = serve(process)
+    body = (FIXTURES / "new_upload.xml").read_bytes()
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        urllib.request.urlopen(urllib.request.Request(url, data=body))
+    assert excinfo.value.code == 500
+
+
+def test_verify_signature_only_accepts_sha_family():
+    body = b"<feed/>"
+    assert verify_signature("key", body, sign("key", body))
+    assert not verify_signature("key", body, "shake_128=00")
+    assert not verify_signature("key", body, "md5=00")
+
+
+def test_renewal_resubscribes_before_lease_expires():
+    calls = []
+    renewed = threading.Event()
+
+    def fake_subscribe(callback_url, channel_id, secret, lease_seconds):
+        calls.append((callback_url, channel_id, lease_seconds))
+        if len(calls) == 3:
+            renewed.set()
+        return 202
+
+    stop = start_renewal("https://example.com/websub", "CHANNEL_ID", lease_seconds=0.05,
+                         subscribe_func=fake_subscribe)
+    try:
+        assert renewed.wait(2)
+    finally:
+        stop.set()
+    assert calls[0] == ("https://example.com/websub", "CHANNEL_ID", 0.05)
@@ -0,0 +1,102 @@
+import gzip
+import socket
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from googleapiclient.discovery import build
+
+from src.youtube_api import LEAN_FIELDS, MeteredHttp, _list_upload_video_ids, _list_videos
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "youtube"
+CHANNEL_ID = "UCxxxxxxxxxxxxxxxxxxxxxx"
+
+
+def fixture_name(endpoint, query):
+    if endpoint == "playlistItems":
+        endpoint += ".page2" if query.get("pageToken") else ".page1"
+    return f"{endpoint}.{'lean' if 'fields' in query else 'full'}.json"
+
+
+@pytest.fixture
+def api():
+    """以錄下的回應模擬 YouTube Data API，並記錄收到的請求"""
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urllib.parse.urlparse(self.path)
+            query = {key: values[0] for key, values in urllib.parse.parse_qs(url.query).items()}
+            endpoint = url.path.rsplit("/", 1)[-1]
+            requests.append((endpoint, query))
+            body = (FIXTURES / fixture_name(endpoint, query)).read_bytes()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=UTF-8")
+            if "gzip" in self.headers.get("Accept-Encoding", "") and "gzip" in self.headers.get("User-Agent", ""):
+                body = gzip.compress(body)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/", requests
+    server.shutdown()
+    server.server_close()
+
+
+def crawl(endpoint_url, lean):
+    http = MeteredHttp()
+    youtube = build("youtube", "v3", developerKey="key", http=http,
+                    client_options={"api_endpoint": endpoint_url}, static_discovery=True)
+    video_ids = _list_upload_video_ids(youtube, CHANNEL_ID, lean)
+    videos = _list_videos(youtube, video_ids, lean)
+    return video_ids, videos, http.calls
+
+
+def test_lean_projection_parses_like_full_response(api):
+    endpoint_url, requests = api
+    full_ids, full_videos, _ = crawl(endpoint_url, lean=False)
+    assert all("fields" not in query for _, query in requests)
+
+    requests.clear()
+    lean_ids, lean_videos, _ = crawl(endpoint_url, lean=True)
+    assert lean_ids == full_ids and len(lean_ids) == 4
+    assert lean_videos == full_videos
+    assert lean_videos[0].title == "趙孟頫 每日一字 1423閶~全集09篇"
+    assert [endpoint for endpoint, _ in requests] == ["channels", "playlistItems", "playlistItems", "videos"]
+    assert all(query["fields"] == LEAN_FIELDS[endpoint] for endpoint, query in requests)
+
+
+def test_lean_mode_cuts_payload_and_records_bytes(api):
+    endpoint_url, _ = api
+    _, _, full_calls = crawl(endpoint_url, lean=False)
+    _, _, lean_calls = crawl(endpoint_url, lean=True)
+
+    assert all(call.encoding == "gzip" and call.wire_bytes < call.decoded_bytes for call in lean_calls)
+    full_bytes = sum(call.decoded_bytes for call in full_calls)
+    lean_bytes = sum(call.decoded_bytes for call in lean_calls)
+    assert lean_bytes * 10 <= full_bytes
+
+
+def test_metered_http_times_out_on_stalled_server():
+    """伺服器接受連線但不回應時，request() 應在逾時後放棄而不是一直等待"""
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    try:
+        http = MeteredHttp(timeout=0.2)
+        start = time.perf_counter()
+        with pytest.raises(OSError):
+            http.request(f"http://127.0.0.1:{listener.getsockname()[1]}/youtube/v3/videos")
+        assert time.perf_counter() - start < 5
+        assert http.calls == []
+    finally:
+        listener.close()